@@ -1,34 +1,228 @@
-from fastapi import FastAPI, Body, Depends, Request
-from sqlalchemy.orm import Session
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+from datetime import datetime
+from fastapi import FastAPI, Body, Depends, Request, Query, Response
+from fastapi.responses import StreamingResponse, PlainTextResponse
+from app.utils.responses import ORJSONResponse
+from app.utils.compression import CompressionMiddleware
+from sqlalchemy import Index, select, delete, literal, tuple_, inspect, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.auth.auth_handler import sign_jwt, hash_password, get_current_user
 from app.request_schemas import UserSignupSchema, UserLoginSchema
-from app.database import get_db, engine
+from app.database import get_db, engine, open_session, write_queue
 from app.models.user import User
 from app.models.news import News
 from app.models import user as models
-from app.models.interest import Interest
-from app.request_schemas import UserInterestsCreateUpdateSchema
-from app.profile.profile_handler import create_user_profile
+from app.models.interest import user_interests
+from app.request_schemas import UserInterestsCreateUpdateSchema, BookmarksBulkSchema
+from app.response_schemas import (
+    NewsSchema, UserSchema, NewsListResponse, InterestListResponse, UserResponse,
+    serialize_many, serialize, parse_fields, project_schema, projection_columns
+)
+from app.profile.profile_handler import create_user_profile, set_user_interests
+from app.utils.interest_catalog import interest_catalog
+from app.ingestion.scheduler import IngestionScheduler
+from app.ingestion.follower import IngestionFollower
 from app.langgraph.graph import create_news_processing_graph
+from app.langgraph.tools.content_tools import create_provider_client
 from decouple import config
+import orjson
+import httpx
 from app.utils.cache import TTLCache
+from app.utils.shared_cache import SQLiteCache
+from app.utils.leader import LeaderElection
+from app.utils.pagination import encode_cursor, decode_cursor, encode_search_cursor, decode_search_cursor
+from app.utils.broadcast import news_broadcaster
+from app.utils.search import ensure_search_index, match_expression, candidate_floor, search_query
 from app.models.bookmark import Bookmark
+from app.feed.ranker import feed_index, FEED_WEIGHTS
+from app.utils.metrics import registry as metrics_registry, METRICS_ENABLED
+from app.utils.etag import (
+    NEWS_VERSION, INGESTION_VERSION, news_version, bookmarks_version_key, bump_versions, read_versions, make_etag, etag_matches, not_modified
+)
 
 
+def drop_duplicate_rows(index: Index) -> None:
+    """Keep only the first row of each repeated key, which would otherwise stop the unique index from being created"""
+    table = index.table.name
+    if index.name in {existing["name"] for existing in inspect(engine).get_indexes(table)}:
+        return
+    columns = [column.name for column in index.columns]
+    with engine.begin() as connection:
+        result = connection.execute(text(
+            f"DELETE FROM {table} WHERE rowid NOT IN (SELECT MIN(rowid) FROM {table} GROUP BY {', '.join(columns)}) "
+            # Rows with a NULL in the key never conflict in a unique index
+            f"AND {' AND '.join(f'{column} IS NOT NULL' for column in columns)}"
+        ))
+    if result.rowcount:
+        print(f"Removed {result.rowcount} duplicate rows from {table} before creating {index.name}")
+
 # Create tables
 models.Base.metadata.create_all(bind=engine)
+# Databases from before the unique link indexes may hold the same bookmark or interest twice
+for index in [*Bookmark.__table__.indexes, *user_interests.indexes]:
+    if index.unique:
+        drop_duplicate_rows(index)
+# create_all skips indexes on tables that already exist
+for index in [*News.__table__.indexes, *Bookmark.__table__.indexes, *user_interests.indexes]:
+    index.create(bind=engine, checkfirst=True)
+# ...and columns added to existing tables
+if "canonical_url" not in {column["name"] for column in inspect(engine).get_columns("news")}:
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE news ADD COLUMN canonical_url VARCHAR"))
+ensure_search_index(engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Articles are fetched and enriched in the background; /news only reads stored rows
+    graph_config = {
+        "openai_api_key": config("openai_api_key"),
+        "model_name": "gpt-4o-mini",
+        "temperature": 0.2,
+        "max_concurrency": config("llm_max_concurrency", default=5, cast=int),
+        "enrichment_mode": config("enrichment_mode", default="separate"),
+        "enrichment_batch_size": config("enrichment_batch_size", default=8, cast=int),
+        "enrichment_cache_ttl_seconds": config("enrichment_cache_ttl_seconds", default=30 * 24 * 3600, cast=int),
+        "enrichment_cache_max_entries": config("enrichment_cache_max_entries", default=50000, cast=int),
+        "dedupe_enabled": config("dedupe_enabled", default=True, cast=bool),
+        "dedupe_threshold": config("dedupe_threshold", default=0.6, cast=float),
+        "dedupe_window_days": config("dedupe_window_days", default=7, cast=int)
+    }
+
+    def reset_news_state() -> None:
+        app.state.news_cache.clear()
+        feed_index.invalidate()
+
+    async def on_ingested() -> None:
+        reset_news_state()
+        # Tells the other workers' followers that a cycle finished
+        await write_queue.submit(lambda db: db.execute(bump_versions(INGESTION_VERSION)))
+
+    # The graph, its agents and their HTTP connection pools are built once per process
+    llm_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(config("llm_timeout_seconds", default=60.0, cast=float)),
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    )
+    provider_client = create_provider_client()
+    app.state.graph = create_news_processing_graph(graph_config, llm_client=llm_client, provider_client=provider_client)
+
+    scheduler = IngestionScheduler(
+        app.state.graph,
+        interval_seconds=config("ingestion_interval_seconds", default=900, cast=int),
+        on_complete=on_ingested,
+        max_concurrency=config("ingestion_category_concurrency", default=8, cast=int),
+        refresh_min_interval_seconds=config("ingestion_refresh_min_interval_seconds", default=60, cast=float)
+    )
+    app.state.ingestion = scheduler
+
+    ingestion_enabled = config("ingestion_enabled", default=True, cast=bool)
+
+    def on_elected() -> None:
+        if ingestion_enabled:
+            scheduler.start()
+
+    # With several workers only the one holding the lock file ingests; the others serve reads
+    leader = LeaderElection(
+        config("leader_lock_path", default="ingestion.lock"),
+        retry_seconds=config("leader_retry_seconds", default=10, cast=float),
+        on_elected=on_elected
+    )
+    app.state.leader = leader
+    follower = IngestionFollower(
+        leader,
+        poll_seconds=config("follower_poll_seconds", default=1.0, cast=float),
+        on_ingested=reset_news_state
+    )
+
+    write_queue.start()
+    app.state.news_cache.start_sweeper()
+    if leader.try_acquire():
+        on_elected()
+    else:
+        leader.start()
+        follower.start()
+    yield
+    await follower.stop()
+    # Stop ingesting before giving up the lock, so two workers never ingest at once
+    await scheduler.stop()
+    await leader.stop()
+    await app.state.news_cache.stop_sweeper()
+    await write_queue.stop()
+    await llm_client.aclose()
+    await provider_client.aclose()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+if config("compression_enabled", default=True, cast=bool):
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config("compression_minimum_size", default=1024, cast=int),
+        gzip_level=config("compression_gzip_level", default=6, cast=int),
+        brotli_quality=config("compression_brotli_quality", default=4, cast=int)
+    )
+NEWS_CACHE_OPTIONS = {
+    "max_entries": config("news_cache_max_entries", default=1024, cast=int),
+    "max_bytes": config("news_cache_max_bytes", default=64 * 1024 * 1024, cast=int),
+    "ttl_seconds": config("news_cache_ttl_seconds", default=300, cast=int),
+    "stale_seconds": config("news_cache_stale_seconds", default=300, cast=int)
+}
+# "memory" is per process; "sqlite" is one cache shared by every worker on the host
+if config("news_cache_backend", default="memory") == "sqlite":
+    app.state.news_cache = SQLiteCache(config("news_cache_path", default="news_cache.db"), **NEWS_CACHE_OPTIONS)
+else:
+    app.state.news_cache = TTLCache(**NEWS_CACHE_OPTIONS)
+metrics_registry.register_cache("news", app.state.news_cache)
+
+NEWS_FIELDS = tuple(NewsSchema.model_fields)
+# Responses are per user, and clients must revalidate with If-None-Match before reusing them
+POLL_HEADERS = {"Cache-Control": "private, no-cache"}
+# Per-user bodies also vary with the caller, so a browser shared by two accounts keeps them apart
+USER_POLL_HEADERS = {**POLL_HEADERS, "Vary": "Authorization"}
+
+async def load_news(category: str, limit: int, cursor: Optional[str] = None, fields: tuple = NEWS_FIELDS) -> dict:
+    """Read one page of processed articles for a category, or for every category when category is "all" """
+    async with open_session() as db:
+        # Select plain columns so no ORM objects or identity map entries are built, and only the requested ones
+        query = select(*projection_columns(News, fields, "id", "published_at")).where(News.processing_status == "completed")
+        if category != "all":
+            query = query.where(News.category == category)
+
+        # Keyset pagination: continue strictly after the last (published_at, id) returned
+        if cursor:
+            published_at, last_id = decode_cursor(cursor)
+            query = query.where(tuple_(News.published_at, News.id) < tuple_(published_at, last_id))
 
-app = FastAPI()
-app.state.news_cache = TTLCache()
+        result = await db.execute(query.order_by(News.published_at.desc(), News.id.desc()).limit(limit + 1))
+        news_items = result.all()
+
+        next_cursor = None
+        if len(news_items) > limit:
+            news_items = news_items[:limit]
+            next_cursor = encode_cursor(news_items[-1].published_at, news_items[-1].id)
+
+        return {
+            "data": serialize_many(project_schema(NewsSchema, fields), news_items),
+            "count": len(news_items),
+            "next_cursor": next_cursor,
+            "success": True
+        }
 
 @app.get("/", tags=["root"])
 async def read_root() -> dict:
     return {"message": "running", "success": True}
 
+@app.get("/metrics", tags=["root"], include_in_schema=False)
+async def metrics() -> Response:
+    """Pipeline, provider, LLM, cache and database metrics in the Prometheus text format"""
+    if not METRICS_ENABLED:
+        return ORJSONResponse({"message": "Metrics are disabled", "success": False}, status_code=404)
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.post("/signup", tags=["user"])
-async def create_user(user: UserSignupSchema = Body(...), db: Session = Depends(get_db)):
+async def create_user(user: UserSignupSchema = Body(...), db: AsyncSession = Depends(get_db)):
     # Check if user exists
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = await db.scalar(select(User).where(User.email == user.email))
     if db_user:
         return {
             "message": "Email already registered",
@@ -43,18 +237,18 @@ async def create_user(user: UserSignupSchema = Body(...), db: Session = Depends(
         password=hashed_password,
     )
 
-    await create_user_profile(db_user.id, user.interests, db)
-
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+
+    # The user needs an ID before interests can be linked to it
+    await create_user_profile(db_user.id, user.interests, db)
     
     token_response = sign_jwt({"user_id": db_user.id })
-    return {**token_response, "user": db_user, "success": True}
+    return {**token_response, "user": serialize(UserSchema, db_user), "success": True}
 
 @app.post("/login", tags=["user"])
-async def login_user(user: UserLoginSchema = Body(...), db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def login_user(user: UserLoginSchema = Body(...), db: AsyncSession = Depends(get_db)):
+    db_user = await db.scalar(select(User).where(User.email == user.email))
     if not db_user:
         return {
             "message": "Invalid credentials",
@@ -66,144 +260,108 @@ async def login_user(user: UserLoginSchema = Body(...), db: Session = Depends(ge
             "success": False
         }
     token_response = sign_jwt({"user_id": db_user.id })
-    return {**token_response, "user": db_user, "success": True}
+    return {**token_response, "user": serialize(UserSchema, db_user), "success": True}
 
-@app.get("/user/{user_id}", tags=["user"])
-async def get_user(user_id: int, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+@app.get("/user/{user_id}", tags=["user"], responses={200: {"model": UserResponse}})
+async def get_user(user_id: int, db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
     if not current_user:
         return {
             "message": "Unauthorized",
             "success": False
         }
     
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = await db.get(User, user_id)
     if not db_user:
         return {
             "message": "User not found",
             "success": False
         }
-    return {
-        "data": db_user,
+    return ORJSONResponse({
+        "data": serialize(UserSchema, db_user),
         "success": True
-    }
+    })
 
-@app.get("/interests", tags=["interests"])
-async def get_interests(
-    db: Session = Depends(get_db)
-):
-    interests = db.query(Interest).all()
-    return {"data": interests, "success": True}
+@app.get("/interests", tags=["interests"], responses={200: {"model": InterestListResponse}})
+async def get_interests(request: Request):
+    # Served from the in-process catalog; the body and its ETag are rendered once per load
+    catalog = await interest_catalog.get()
+
+    if etag_matches(request, catalog.etag):
+        return not_modified(catalog.etag)
+    return Response(content=catalog.body, media_type="application/json", headers={"ETag": catalog.etag})
 
 @app.put("/users/me/interests", tags=["interests"])
 async def update_user_interests(
     interests: UserInterestsCreateUpdateSchema = Body(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     if not current_user:
         return {"message": "Unauthorized", "success": False}
     
-    user = db.query(User).filter(User.id == current_user["user_id"]).first()
+    user = await db.get(User, current_user["user_id"])
     if not user:
         return {"message": "User not found", "success": False}
     
-    # Clear existing interests
-    user.interests = []
-    
-    # Add new interests
-    for interest_id in interests.interest_ids:
-        interest = db.query(Interest).filter(Interest.id == interest_id).first()
-        if interest:
-            user.interests.append(interest)
-    
-    db.commit()
+    await set_user_interests(user.id, interests.interest_ids, db)
     return {"message": "Interests updated successfully", "success": True}
 
 @app.get("/users/me/interests", tags=["user"])
 async def get_user_interests(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     if not current_user:
         return {"message": "Unauthorized", "success": False}
     
-    user = db.query(User).filter(User.id == current_user["user_id"]).first()
+    user = await db.get(User, current_user["user_id"])
     if not user:
         return {"message": "User not found", "success": False}
-    
-    return {"data": user.interests, "success": True}
 
-@app.get("/news", tags=["news"])
+    # Resolve names from the catalog instead of joining the interests table
+    result = await db.execute(
+        select(user_interests.c.interest_id).where(user_interests.c.user_id == user.id)
+    )
+    catalog = await interest_catalog.get()
+    data = [
+        {"id": interest_id, "name": catalog.by_id[interest_id]}
+        for interest_id in sorted(result.scalars().all()) if interest_id in catalog.by_id
+    ]
+    return ORJSONResponse({"data": data, "success": True})
+
+@app.get("/news", tags=["news"], responses={200: {"model": NewsListResponse}})
 async def get_news(
     request: Request,
     category: str = "all",
-    db: Session = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated article fields to return; id is always included"),
     current_user: dict = Depends(get_current_user)
 ):
     if not current_user:
         return {"message": "Unauthorized", "success": False}
-    
+
     try:
-        cache_key = f"news_{current_user['user_id']}_{category}"
+        names = parse_fields(NewsSchema, fields)
+    except ValueError as e:
+        return {"message": str(e), "success": False}
 
-        cached_result = request.app.state.news_cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+    try:
+        # Every save bumps the news version, so a poll with the current ETag skips the query entirely
+        version = await news_version.get()
+        etag = make_etag("news", version)
+        if etag_matches(request, etag):
+            return not_modified(etag, POLL_HEADERS)
 
-        # Initialize config for the graph
-        graph_config = {
-            "openai_api_key": config("openai_api_key"),
-            "model_name": "gpt-4o-mini",
-            "temperature": 0.2
-        }
-        
-        # Create the processing graph
-        graph = create_news_processing_graph(graph_config)
-        
-        if category == "all":
-            # Get all categories from seed.py
-            categories = db.query(Interest.name).distinct().all()
-            categories = [category[0] for category in categories]
-            
-            for cat in categories:
-                await graph.ainvoke({
-                    "category": cat
-                })
-            
-            # Get processed news from database
-            news_items = db.query(News).filter(
-                News.processing_status == "completed"
-            ).order_by(News.published_at.desc()).all()
-                        
-            return {
-                "data": news_items,
-                "count": len(news_items),
-                "success": True
-            }
-            
-        else:
-            # Process single category
-            await graph.ainvoke({
-                "category": category
-            })
-
-            # Get processed news from database for the category
-            news_items = db.query(News).filter(
-                News.category == category,
-                News.processing_status == "completed"
-            ).order_by(News.published_at.desc()).all()
-
-            request.app.state.news_cache.set(cache_key, {
-                "data": news_items,
-                "count": len(news_items),
-                "success": True
-            })
-            
-            return {
-                "data": news_items,
-                "count": len(news_items),
-                "success": True
-            }
+        # The feed is the same for every user, so entries are shared per category and page.
+        # Articles are processed by the ingestion scheduler, so only stored rows are read here.
+        # Keyed by version so a body is never served under a newer ETag than the one it was built for
+        result = await request.app.state.news_cache.get_or_load(
+            f"news_{version}_{category}_{limit}_{cursor or ''}_{','.join(names)}",
+            lambda: load_news(category, limit, cursor, names)
+        )
+        # The cached payload is already plain data, so skip jsonable_encoder
+        return ORJSONResponse(result, headers={"ETag": etag, **POLL_HEADERS})
             
     except Exception as e:
         print(f"Error processing news: {str(e)}")
@@ -213,72 +371,334 @@ async def get_news(
             "success": False
         }
 
+STREAM_PAGE_SIZE = 50
+STREAM_HEARTBEAT_SECONDS = config("news_stream_heartbeat_seconds", default=15, cast=int)
+STREAM_IDLE_SECONDS = config("news_stream_idle_seconds", default=120, cast=int)
+
+def ndjson(payload: dict) -> bytes:
+    return orjson.dumps(payload) + b"\n"
+
+@app.get("/news/stream", tags=["news"])
+async def stream_news(
+    request: Request,
+    category: str = "all",
+    limit: int = Query(50, ge=0, le=1000),
+    follow: bool = True,
+    refresh: bool = False,
+    current_user: dict = Depends(get_current_user)
+):
+    """NDJSON stream of stored articles, then of new articles as ingestion saves them"""
+    if not current_user:
+        return {"message": "Unauthorized", "success": False}
+
+    # A refresh starts provider and LLM calls, so it is limited to the categories ingestion knows
+    if refresh and category != "all" and category not in (await interest_catalog.get()).names:
+        return {"message": "Unknown category", "success": False}
+
+    async def lines():
+        # Subscribe before reading stored rows so nothing saved in between is missed
+        async with news_broadcaster.subscribe() as queue:
+            sent = set()
+            cursor, remaining = None, limit
+            # Same keys as /news, so a page saved before the last ingestion is never served after it
+            version = await news_version.get()
+            while remaining > 0:
+                size = min(remaining, STREAM_PAGE_SIZE)
+                # One page in memory at a time, served from the /news cache when possible
+                page = await request.app.state.news_cache.get_or_load(
+                    f"news_{version}_{category}_{size}_{cursor or ''}_{','.join(NEWS_FIELDS)}",
+                    lambda size=size, cursor=cursor: load_news(category, size, cursor)
+                )
+                for item in page["data"]:
+                    sent.add(item["id"])
+                    yield ndjson({"type": "article", "live": False, "data": item})
+                remaining -= page["count"]
+                cursor = page["next_cursor"]
+                if not cursor:
+                    break
+
+            if not follow:
+                yield ndjson({"type": "end"})
+                return
+
+            ingestion = None
+            # Only the leader ingests; elsewhere the stream just follows what the leader saves.
+            # A refresh within the minimum interval of the last one for the category is not repeated.
+            if refresh and request.app.state.leader.is_leader:
+                ingestion = request.app.state.ingestion.refresh(None if category == "all" else [category])
+
+            idle = 0
+            while idle < STREAM_IDLE_SECONDS and not await request.is_disconnected():
+                if ingestion is not None and ingestion.done() and queue.empty():
+                    break
+                # Wake on a new article, on the requested ingestion finishing, or for a heartbeat
+                getter = asyncio.ensure_future(queue.get())
+                waiters = {getter} if ingestion is None or ingestion.done() else {getter, ingestion}
+                done, _ = await asyncio.wait(waiters, timeout=STREAM_HEARTBEAT_SECONDS, return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    getter.cancel()
+                    if not done:
+                        idle += STREAM_HEARTBEAT_SECONDS
+                        yield ndjson({"type": "heartbeat"})
+                    continue
+
+                idle = 0
+                item = getter.result()
+                if (category != "all" and item["category"] != category) or item["id"] in sent:
+                    continue
+                sent.add(item["id"])
+                yield ndjson({"type": "article", "live": True, "data": item})
+
+            yield ndjson({"type": "end"})
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+SEARCH_MAX_CANDIDATES = config("search_max_candidates", default=5000, cast=int)
+
+@app.get("/news/search", tags=["news"], responses={200: {"model": NewsListResponse}})
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=200),
+    category: Optional[str] = None,
+    sentiment: Optional[str] = None,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated article fields to return; id is always included"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if not current_user:
+        return {"message": "Unauthorized", "success": False}
+
+    match = match_expression(q)
+    if match is None:
+        return {"message": "Query has no searchable terms", "success": False}
+
+    try:
+        names = parse_fields(NewsSchema, fields)
+        rank, last_id, min_id = decode_search_cursor(cursor) if cursor else (None, None, None)
+    except ValueError as e:
+        return {"message": str(e), "success": False}
+
+    if not cursor and SEARCH_MAX_CANDIDATES:
+        # Terms that match a large share of the corpus are ranked among their newest matches only
+        min_id = await db.scalar(candidate_floor(match, SEARCH_MAX_CANDIDATES))
+
+    rows = (await db.execute(search_query(
+        projection_columns(News, names, "id"),
+        match,
+        limit + 1,
+        category=category,
+        sentiment=sentiment,
+        published_from=published_from,
+        published_to=published_to,
+        after=(rank, last_id) if cursor else None,
+        min_id=min_id
+    ))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_search_cursor(rows[-1].rank, rows[-1].id, min_id)
+
+    return ORJSONResponse({
+        "data": serialize_many(project_schema(NewsSchema, names), rows),
+        "count": len(rows),
+        "next_cursor": next_cursor,
+        "success": True
+    })
+
+@app.get("/feed", tags=["news"], responses={200: {"model": NewsListResponse}})
+async def get_feed(
+    limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated article fields to return; id is always included"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if not current_user:
+        return {"message": "Unauthorized", "success": False}
+
+    try:
+        names = parse_fields(NewsSchema, fields)
+    except ValueError as e:
+        return {"message": str(e), "success": False}
+
+    try:
+        user_id = current_user["user_id"]
+        catalog = await interest_catalog.get()
+        interest_ids = (await db.execute(
+            select(user_interests.c.interest_id).where(user_interests.c.user_id == user_id)
+        )).scalars().all()
+        # Only the recent bookmarks shape the source and sentiment preferences
+        bookmarked = (await db.execute(
+            select(News.source, News.sentiment)
+            .join(Bookmark, Bookmark.news_id == News.id)
+            .where(Bookmark.user_id == user_id)
+            .order_by(Bookmark.id.desc())
+            .limit(config("feed_bookmark_history", default=500, cast=int))
+        )).all()
+
+        # Every candidate is scored from in-memory arrays; only the top rows are read back
+        index = await feed_index.get()
+        ranked = index.rank(
+            interests=[catalog.by_id[i] for i in interest_ids if i in catalog.by_id],
+            bookmarked_sources=[row.source for row in bookmarked],
+            bookmarked_sentiments=[row.sentiment for row in bookmarked],
+            k=limit,
+            weights=FEED_WEIGHTS
+        )
+
+        rows = (await db.execute(
+            select(*projection_columns(News, names, "id")).where(News.id.in_([news_id for news_id, _ in ranked]))
+        )).all()
+        rows_by_id = {row.id: row for row in rows}
+        ordered = [rows_by_id[news_id] for news_id, _ in ranked if news_id in rows_by_id]
+
+        return ORJSONResponse({
+            "data": serialize_many(project_schema(NewsSchema, names), ordered),
+            "count": len(ordered),
+            "success": True
+        })
+
+    except Exception as e:
+        print(f"Error building feed: {str(e)}")
+        return {
+            "message": "Error building feed",
+            "error": str(e),
+            "success": False
+        }
+
+def bookmark_insert(user_id: int, news_ids: list[int]):
+    """INSERT ... SELECT that bookmarks the existing articles among news_ids, skipping duplicates"""
+    return insert(Bookmark).from_select(
+        ["user_id", "news_id"],
+        select(literal(user_id), News.id).where(News.id.in_(news_ids))
+    ).on_conflict_do_nothing(index_elements=["user_id", "news_id"])
+
 @app.post("/bookmarks/{news_id}", tags=["bookmarks"])
 async def add_bookmark(
     news_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    print(current_user)
     if not current_user:
         return {"message": "Unauthorized", "success": False}
     
-    # Check if news exists
-    news = db.query(News).filter(News.id == news_id).first()
-    if not news:
-        return {"message": "News not found", "success": False}
-    
-    # Check if bookmark already exists
-    existing_bookmark = db.query(Bookmark).filter(
-        Bookmark.user_id == current_user["user_id"],
-        Bookmark.news_id == news_id
-    ).first()
-    
-    if existing_bookmark:
+    result = await db.execute(bookmark_insert(current_user["user_id"], [news_id]))
+    if result.rowcount:
+        await db.execute(bump_versions(bookmarks_version_key(current_user["user_id"])))
+    await db.commit()
+
+    if result.rowcount == 0:
+        # Nothing inserted: either the article does not exist or it is already bookmarked
+        if await db.get(News, news_id) is None:
+            return {"message": "News not found", "success": False}
         return {"message": "Bookmark already exists", "success": False}
     
-    # Create new bookmark
-    bookmark = Bookmark(user_id=current_user["user_id"], news_id=news_id)
-    db.add(bookmark)
-    db.commit()
-    
     return {"message": "Bookmark added successfully", "success": True}
 
+@app.post("/bookmarks", tags=["bookmarks"])
+async def add_bookmarks(
+    bookmarks: BookmarksBulkSchema = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if not current_user:
+        return {"message": "Unauthorized", "success": False}
+
+    result = await db.execute(bookmark_insert(current_user["user_id"], bookmarks.news_ids))
+    if result.rowcount:
+        await db.execute(bump_versions(bookmarks_version_key(current_user["user_id"])))
+    await db.commit()
+
+    return {"message": "Bookmarks added successfully", "added": result.rowcount, "success": True}
+
 @app.delete("/bookmarks/{news_id}", tags=["bookmarks"])
 async def remove_bookmark(
     news_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     if not current_user:
         return {"message": "Unauthorized", "success": False}
     
-    bookmark = db.query(Bookmark).filter(
+    result = await db.execute(delete(Bookmark).where(
         Bookmark.user_id == current_user["user_id"],
         Bookmark.news_id == news_id
-    ).first()
+    ))
+    if result.rowcount:
+        await db.execute(bump_versions(bookmarks_version_key(current_user["user_id"])))
+    await db.commit()
     
-    if not bookmark:
+    if result.rowcount == 0:
         return {"message": "Bookmark not found", "success": False}
     
-    db.delete(bookmark)
-    db.commit()
-    
     return {"message": "Bookmark removed successfully", "success": True}
 
-@app.get("/bookmarks", tags=["bookmarks"])
+@app.delete("/bookmarks", tags=["bookmarks"])
+async def remove_bookmarks(
+    bookmarks: BookmarksBulkSchema = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if not current_user:
+        return {"message": "Unauthorized", "success": False}
+
+    result = await db.execute(delete(Bookmark).where(
+        Bookmark.user_id == current_user["user_id"],
+        Bookmark.news_id.in_(bookmarks.news_ids)
+    ))
+    if result.rowcount:
+        await db.execute(bump_versions(bookmarks_version_key(current_user["user_id"])))
+    await db.commit()
+
+    return {"message": "Bookmarks removed successfully", "removed": result.rowcount, "success": True}
+
+@app.get("/bookmarks", tags=["bookmarks"], responses={200: {"model": NewsListResponse}})
 async def get_bookmarks(
-    db: Session = Depends(get_db),
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated article fields to return; id is always included"),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     if not current_user:
         return {"message": "Unauthorized", "success": False}
+
+    try:
+        names = parse_fields(NewsSchema, fields)
+    except ValueError as e:
+        return {"message": str(e), "success": False}
+
+    # The page changes when this user's bookmarks change or when a saved article is updated.
+    # Per-user counters collide across users, so the user is part of the tag.
+    versions = await read_versions(db, [bookmarks_version_key(current_user["user_id"]), NEWS_VERSION])
+    etag = make_etag("bookmarks", current_user["user_id"], *versions.values())
+    if etag_matches(request, etag):
+        return not_modified(etag, USER_POLL_HEADERS)
+
+    # One joined query for the page; newest bookmarks first, paginated on the bookmark id
+    query = select(*projection_columns(News, names), Bookmark.id.label("bookmark_id")).join(
+        Bookmark, Bookmark.news_id == News.id
+    ).where(Bookmark.user_id == current_user["user_id"])
+
+    if cursor:
+        if not cursor.isdigit():
+            return {"message": "Invalid cursor", "success": False}
+        query = query.where(Bookmark.id < int(cursor))
+
+    rows = (await db.execute(query.order_by(Bookmark.id.desc()).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = str(rows[-1].bookmark_id)
     
-    bookmarks = db.query(Bookmark).filter(
-        Bookmark.user_id == current_user["user_id"]
-    ).all()
-    
-    return {
-        "data": [bookmark.news for bookmark in bookmarks],
+    return ORJSONResponse({
+        "data": serialize_many(project_schema(NewsSchema, names), rows),
+        "count": len(rows),
+        "next_cursor": next_cursor,
         "success": True
-    }
+    }, headers={"ETag": etag, **USER_POLL_HEADERS})
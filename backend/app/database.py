@@ -1,19 +1,182 @@
-from sqlalchemy import create_engine
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+from decouple import config
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
+from app.utils.metrics import METRICS_ENABLED, instrument_engine
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./sql_app.db"
+SQLALCHEMY_DATABASE_URL = config("database_url", default="sqlite:///./sql_app.db")
+ASYNC_DATABASE_URL = config("async_database_url", default="sqlite+aiosqlite:///./sql_app.db")
+# "async" uses the aiosqlite driver; "thread" runs the sync driver in a worker thread per call
+DATABASE_MODE = config("database_mode", default="async")
+# "tuned" applies WAL and the pragmas below on every connection; "plain" keeps SQLite defaults
+DATABASE_PROFILE = config("database_profile", default="tuned")
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": config("sqlite_synchronous", default="NORMAL"),
+    "cache_size": -config("sqlite_cache_size_kb", default=65536, cast=int),
+    "mmap_size": config("sqlite_mmap_size", default=268435456, cast=int),
+    "busy_timeout": config("sqlite_busy_timeout_ms", default=5000, cast=int),
+    "temp_store": "MEMORY",
+}
+
+def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+def create_db_engine(
+    url: str,
+    profile: str = DATABASE_PROFILE,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None
+) -> Any:
+    """Create a sync or async (aiosqlite) SQLite engine for the given profile"""
+    options = {"connect_args": {"check_same_thread": False}}
+    in_memory = url.endswith("://") or ":memory:" in url
+    if profile == "tuned" and not in_memory:
+        options["pool_size"] = pool_size or config("database_pool_size", default=5, cast=int)
+        options["max_overflow"] = max_overflow if max_overflow is not None else config("database_max_overflow", default=10, cast=int)
+
+    if "+aiosqlite" in url:
+        db_engine = create_async_engine(url, **options)
+        sync_engine = db_engine.sync_engine
+    else:
+        db_engine = sync_engine = create_engine(url, **options)
+
+    if profile == "tuned":
+        event.listen(sync_engine, "connect", _apply_pragmas)
+    if METRICS_ENABLED:
+        instrument_engine(sync_engine)
+    return db_engine
+
+engine: Engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_db_engine(ASYNC_DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+class ThreadedSession:
+    """Awaitable facade over a sync Session that runs each database call in a worker thread"""
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def __aenter__(self) -> "ThreadedSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def add(self, instance: Any) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances: Any) -> None:
+        self.sync_session.add_all(instances)
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.execute, *args, **kwargs)
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.scalar, *args, **kwargs)
+
+    async def scalars(self, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.scalars, *args, **kwargs)
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.get, *args, **kwargs)
+
+    async def merge(self, instance: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.merge, instance, **kwargs)
+
+    async def delete(self, instance: Any) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def refresh(self, instance: Any) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+def open_session():
+    """Session for the configured database mode, usable as `async with open_session() as db`"""
+    if DATABASE_MODE == "thread":
+        return ThreadedSession(SessionLocal())
+    return AsyncSessionLocal()
+
+async def get_db():
+    async with open_session() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+class WriteQueue:
+    """
+    Runs database writes one at a time from a single worker task
+
+    SQLite allows one writer at a time, so funnelling ingestion writes through
+    here avoids "database is locked" retries while readers keep going under WAL.
+    """
+
+    def __init__(self, session_factory: Callable[[], Any] = open_session):
+        self.session_factory = session_factory
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def submit(self, operation: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Queue operation(db) and wait for it to run and commit, re-raising its error"""
+        self.start()
+        future = self._loop.create_future()
+        await self._queue.put((operation, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            operation, future = await self._queue.get()
+            if future.cancelled():
+                continue
+            async with self.session_factory() as db:
+                try:
+                    result = await operation(db)
+                    await db.commit()
+                    if not future.done():
+                        future.set_result(result)
+                except Exception as e:
+                    await db.rollback()
+                    if not future.done():
+                        future.set_exception(e)
+
+write_queue = WriteQueue()
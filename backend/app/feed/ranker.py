@@ -0,0 +1,155 @@
+import asyncio
+import time
+from datetime import timezone
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from decouple import config
+from sqlalchemy import select
+from app.database import open_session
+from app.models.news import News
+
+SENTIMENTS = ("positive", "negative", "neutral")
+UNKNOWN = len(SENTIMENTS)
+
+class FeedIndex:
+    """Columnar snapshot of feed candidates, scored per user in one vectorized pass"""
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        published_ts: Sequence[float],
+        categories: Sequence[Optional[str]],
+        sources: Sequence[Optional[str]],
+        sentiments: Sequence[Optional[str]]
+    ):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.published_ts = np.asarray(published_ts, dtype=np.float64)
+
+        self.category_names, self.category_codes = self._encode(categories)
+        self.source_names, self.source_codes = self._encode(sources)
+        self.category_lookup = {name: code for code, name in enumerate(self.category_names)}
+        self.source_lookup = {name: code for code, name in enumerate(self.source_names)}
+
+        sentiment_lookup = {name: code for code, name in enumerate(SENTIMENTS)}
+        self.sentiment_codes = np.fromiter(
+            (sentiment_lookup.get(sentiment, UNKNOWN) for sentiment in sentiments),
+            dtype=np.int8,
+            count=len(self.ids)
+        )
+        self.loaded_at = time.monotonic()
+
+    @staticmethod
+    def _encode(values: Sequence[Optional[str]]):
+        names, codes = np.unique(np.asarray([value or "" for value in values], dtype=object), return_inverse=True)
+        return list(names), codes.astype(np.int32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rank(
+        self,
+        interests: Iterable[str],
+        bookmarked_sources: Iterable[Optional[str]],
+        bookmarked_sentiments: Iterable[Optional[str]],
+        k: int,
+        weights: Dict[str, float],
+        now: Optional[float] = None
+    ) -> List[tuple]:
+        """Return up to k (news_id, score) pairs, best first"""
+        if not len(self.ids):
+            return []
+
+        # Interest-category affinity: 1 for the user's categories, 0 otherwise
+        category_affinity = np.zeros(len(self.category_names), dtype=np.float64)
+        for name in interests:
+            code = self.category_lookup.get(name)
+            if code is not None:
+                category_affinity[code] = 1.0
+
+        # Source affinity learned from bookmarks, scaled to [0, 1]
+        source_affinity = np.zeros(len(self.source_names), dtype=np.float64)
+        for source in bookmarked_sources:
+            code = self.source_lookup.get(source or "")
+            if code is not None:
+                source_affinity[code] += 1.0
+        if source_affinity.max() > 0:
+            source_affinity /= source_affinity.max()
+
+        # Sentiment preference: smoothed share of each sentiment among bookmarks
+        sentiment_preference = np.ones(len(SENTIMENTS) + 1, dtype=np.float64)
+        for sentiment in bookmarked_sentiments:
+            sentiment_preference[SENTIMENTS.index(sentiment) if sentiment in SENTIMENTS else UNKNOWN] += 1.0
+        sentiment_preference /= sentiment_preference.sum()
+
+        # Recency decays by half every half_life_hours
+        now = time.time() if now is None else now
+        age_hours = np.maximum(now - self.published_ts, 0.0) / 3600.0
+        recency = np.exp2(-age_hours / weights["half_life_hours"])
+
+        scores = (
+            weights["interest"] * category_affinity[self.category_codes]
+            + weights["recency"] * recency
+            + weights["source"] * source_affinity[self.source_codes]
+            + weights["sentiment"] * sentiment_preference[self.sentiment_codes]
+        )
+
+        # Select the top k without sorting every candidate, then order just those
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return list(zip(self.ids[top].tolist(), scores[top].tolist()))
+
+class FeedIndexStore:
+    """Builds the feed index on first use and rebuilds it after ingestion or when it ages out"""
+
+    def __init__(self, max_candidates: int = 100000, ttl_seconds: float = 300):
+        self.max_candidates = max_candidates
+        self.ttl_seconds = ttl_seconds
+        self._index: Optional[FeedIndex] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> FeedIndex:
+        index = self._index
+        if index is not None and time.monotonic() - index.loaded_at < self.ttl_seconds:
+            return index
+
+        async with self._lock:
+            index = self._index
+            if index is None or time.monotonic() - index.loaded_at >= self.ttl_seconds:
+                index = self._index = await self._load()
+            return index
+
+    async def _load(self) -> FeedIndex:
+        async with open_session() as db:
+            result = await db.execute(
+                select(News.id, News.published_at, News.category, News.source, News.sentiment)
+                .where(News.processing_status == "completed")
+                .order_by(News.published_at.desc())
+                .limit(self.max_candidates)
+            )
+            rows = result.all()
+
+        return FeedIndex(
+            ids=[row.id for row in rows],
+            # Stored naive in UTC; .timestamp() alone would read them as server-local time
+            published_ts=[row.published_at.replace(tzinfo=timezone.utc).timestamp() if row.published_at else 0.0 for row in rows],
+            categories=[row.category for row in rows],
+            sources=[row.source for row in rows],
+            sentiments=[row.sentiment for row in rows]
+        )
+
+    def invalidate(self) -> None:
+        self._index = None
+
+FEED_WEIGHTS = {
+    "interest": config("feed_interest_weight", default=1.0, cast=float),
+    "recency": config("feed_recency_weight", default=1.0, cast=float),
+    "source": config("feed_source_weight", default=0.5, cast=float),
+    "sentiment": config("feed_sentiment_weight", default=0.25, cast=float),
+    "half_life_hours": config("feed_half_life_hours", default=24.0, cast=float),
+}
+
+feed_index = FeedIndexStore(
+    max_candidates=config("feed_max_candidates", default=100000, cast=int),
+    ttl_seconds=config("feed_index_ttl_seconds", default=300, cast=int)
+)
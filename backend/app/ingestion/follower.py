@@ -0,0 +1,83 @@
+import asyncio
+from typing import Any, Callable, Optional
+from sqlalchemy import select, func
+from app.database import open_session
+from app.models.news import News
+from app.response_schemas import NewsSchema, schema_columns, serialize_many
+from app.utils.broadcast import news_broadcaster
+from app.utils.etag import NEWS_VERSION, INGESTION_VERSION, read_versions
+from app.utils.leader import LeaderElection
+
+class IngestionFollower:
+    """
+    Mirrors the leader's ingestion in a worker that does not ingest itself
+
+    Polls the news and ingestion versions every poll_seconds. Articles the leader
+    saves are relayed to this worker's /news/stream listeners, and on_ingested runs
+    when the leader finishes a cycle. Stops once this worker becomes the leader.
+    """
+
+    def __init__(self, leader: LeaderElection, poll_seconds: float = 1.0, on_ingested: Optional[Callable[[], Any]] = None):
+        self.leader = leader
+        self.poll_seconds = poll_seconds
+        self.on_ingested = on_ingested
+        self.columns = schema_columns(News, NewsSchema)
+        self._versions: Optional[dict] = None
+        self._last_id = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _relay(self, db) -> None:
+        """Publish the articles saved since the last poll, or just skip past them when nobody is listening"""
+        if not news_broadcaster.has_subscribers:
+            self._last_id = await db.scalar(select(func.coalesce(func.max(News.id), 0)))
+            return
+
+        # In pages of one listener queue each, until caught up: the rest would wait for the next version bump
+        page_size = news_broadcaster.max_queue_size
+        while True:
+            result = await db.execute(
+                select(*self.columns)
+                .where(News.id > self._last_id, News.processing_status == "completed")
+                .order_by(News.id)
+                .limit(page_size)
+            )
+            rows = result.all()
+            if rows:
+                self._last_id = rows[-1].id
+                news_broadcaster.publish(serialize_many(NewsSchema, rows))
+            if len(rows) < page_size:
+                return
+
+    async def poll(self) -> None:
+        async with open_session() as db:
+            versions = await read_versions(db, [NEWS_VERSION, INGESTION_VERSION])
+            if self._versions is None:
+                self._last_id = await db.scalar(select(func.coalesce(func.max(News.id), 0)))
+            elif versions[NEWS_VERSION] != self._versions[NEWS_VERSION]:
+                await self._relay(db)
+
+        if self._versions is not None and versions[INGESTION_VERSION] != self._versions[INGESTION_VERSION] and self.on_ingested:
+            self.on_ingested()
+        self._versions = versions
+
+    async def _follow(self) -> None:
+        while not self.leader.is_leader:
+            try:
+                await self.poll()
+            except Exception as e:
+                print(f"Ingestion follower poll failed: {str(e)}")
+            await asyncio.sleep(self.poll_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._follow())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+from datetime import datetime
+from app.utils.interest_catalog import interest_catalog
+from app.utils.concurrency import gather_bounded
+
+class IngestionScheduler:
+    """Runs the news processing graph for every interest category on a fixed interval"""
+
+    def __init__(
+        self,
+        graph: Any,
+        interval_seconds: int = 900,
+        on_complete: Optional[Callable[[], Awaitable[None]]] = None,
+        max_concurrency: int = 8,
+        refresh_min_interval_seconds: float = 60
+    ):
+        # Compiled once by the application and reused for every run
+        self.graph = graph
+        self.interval_seconds = interval_seconds
+        self.on_complete = on_complete
+        self.max_concurrency = max_concurrency
+        self.refresh_min_interval_seconds = refresh_min_interval_seconds
+        self.last_run: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._refreshes: Dict[tuple, asyncio.Task] = {}
+        self._refreshed_at: Dict[tuple, float] = {}
+
+    async def get_categories(self) -> List[str]:
+        """Load the category names from the interest catalog"""
+        catalog = await interest_catalog.get()
+        return list(catalog.names)
+
+    async def run_category(self, category: str) -> Dict[str, Any]:
+        """Run retrieve -> analyze -> summarize -> save for a single category"""
+        try:
+            return await self.graph.ainvoke({"category": category})
+        except Exception as e:
+            print(f"Ingestion error for {category}: {str(e)}")
+            return {"category": category, "error": str(e), "status": "failed"}
+
+    async def run_once(self, categories: Optional[List[str]] = None) -> None:
+        """Ingest the given categories, or every category, once"""
+        # Categories run concurrently; the graph's shared limiters bound LLM and provider calls overall
+        await gather_bounded(categories or await self.get_categories(), self.run_category, self.max_concurrency)
+
+        self.last_run = datetime.now().isoformat()
+        if self.on_complete:
+            await self.on_complete()
+
+    def refresh(self, categories: Optional[List[str]] = None) -> Optional[asyncio.Task]:
+        """
+        Ingest now in the background, sharing the run already in flight for the same categories
+
+        Returns None without starting a run when the same categories were refreshed
+        less than refresh_min_interval_seconds ago.
+        """
+        key = tuple(categories or ())
+        task = self._refreshes.get(key)
+        if task is None or task.done():
+            now = time.monotonic()
+            if now - self._refreshed_at.get(key, float("-inf")) < self.refresh_min_interval_seconds:
+                return None
+            self._refreshed_at[key] = now
+            task = self._refreshes[key] = asyncio.create_task(self.run_once(categories))
+            task.add_done_callback(lambda done: self._refreshes.pop(key, None) if self._refreshes.get(key) is done else None)
+        return task
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"Ingestion cycle failed: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
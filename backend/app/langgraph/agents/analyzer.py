@@ -1,7 +1,16 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import asyncio
+import json
+import httpx
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from datetime import datetime
+from app.utils.concurrency import gather_bounded, SingleFlight
+from app.utils.enrichment_cache import EnrichmentCache
+from app.utils.metrics import invoke_llm
+
+# Bump whenever SENTIMENT_PROMPT changes so cached results are not reused
+SENTIMENT_PROMPT_VERSION = "1"
 
 SENTIMENT_PROMPT = """Analyze the sentiment of the following news article. Your analysis should:
 1. Determine the overall tone (positive, negative, neutral) based on the emotional weight and implications of the content.
@@ -17,38 +26,76 @@ Provide the analysis in the following JSON format:
 """
 
 class SentimentAnalyzerAgent:
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        cache: Optional[EnrichmentCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[asyncio.Semaphore] = None
+    ):
         self.config = config
+        self.cache = cache
         self.llm = ChatOpenAI(
             model=config.get("model_name", "gpt-4o-mini"),
             temperature=0.2,
-            api_key=config.get("openai_api_key")
+            api_key=config.get("openai_api_key"),
+            http_async_client=http_client
         )
         self.prompt = ChatPromptTemplate.from_template(SENTIMENT_PROMPT)
+        self.max_concurrency = config.get("max_concurrency", 5)
+        self.limiter = limiter or asyncio.Semaphore(self.max_concurrency)
+        self.in_flight = SingleFlight()
+
+    async def _sentiment(self, article: Dict[str, Any], cache_key: Optional[str]) -> str:
+        if cache_key:
+            cached_sentiment = await self.cache.get(cache_key)
+            if cached_sentiment is not None:
+                return cached_sentiment
+
+        messages = self.prompt.format_messages(
+            title=article.get("title", ""),
+            description=article.get("description", "")
+        )
+
+        # Shared with every other LLM call of the graph, across categories
+        async with self.limiter:
+            response = await invoke_llm(self.llm, messages, "analyzer")
+
+        # Clean the response by removing markdown code block syntax
+        cleaned_response = response.content
+        if cleaned_response.startswith("```"):
+            # Remove the first line (```json) and last line (```)
+            cleaned_response = "\n".join(cleaned_response.split("\n")[1:-1])
+
+        # Parse the JSON response
+        sentiment_data = json.loads(cleaned_response)
+
+        if cache_key:
+            await self.cache.set(cache_key, "sentiment", sentiment_data["sentiment"])
+        return sentiment_data["sentiment"]
 
     async def analyze_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze sentiment for a single article"""
         try:
-            messages = self.prompt.format_messages(
-                title=article.get("title", ""),
-                description=article.get("description", "")
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.make_key(
+                    "sentiment",
+                    SENTIMENT_PROMPT_VERSION,
+                    self.config.get("model_name", "gpt-4o-mini"),
+                    article.get("title", ""),
+                    article.get("description", "")
+                )
+
+            # The same article arriving from several categories at once is analyzed once
+            sentiment = await self.in_flight.run(
+                cache_key or ("sentiment", article.get("title", ""), article.get("description", "")),
+                lambda: self._sentiment(article, cache_key)
             )
-            
-            response = await self.llm.ainvoke(messages)
-
-            # Clean the response by removing markdown code block syntax
-            cleaned_response = response.content
-            if cleaned_response.startswith("```"):
-                # Remove the first line (```json) and last line (```)
-                cleaned_response = "\n".join(cleaned_response.split("\n")[1:-1])
-            
-            # Parse the JSON response
-            import json
-            sentiment_data = json.loads(cleaned_response)
-            
+
             return {
                 **article,
-                "sentiment": sentiment_data["sentiment"]
+                "sentiment": sentiment
             }
 
         except Exception as e:
@@ -63,19 +110,17 @@ class SentimentAnalyzerAgent:
         """Process articles for sentiment analysis"""
         articles = state.get("articles", [])
         
+        # Nothing new since the last run is the normal idle case, not a failure
         if not articles:
-            return {
-                **state,
-                "error": "No articles to analyze",
-                "status": "failed"
-            }
+            return state
 
-        analyzed_articles = []
-        
-        # Process each article
-        for article in articles:
-            analyzed_article = await self.analyze_article(article)
-            analyzed_articles.append(analyzed_article)
+        # Analyze articles concurrently, keeping their order
+        results = await gather_bounded(articles, self.analyze_article, self.max_concurrency)
+        analyzed_articles = [
+            result if not isinstance(result, BaseException)
+            else {**article, "sentiment": "unknown", "error": str(result)}
+            for article, result in zip(articles, results)
+        ]
 
         return {
             **state,
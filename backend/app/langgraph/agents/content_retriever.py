@@ -1,12 +1,12 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..tools.content_tools import NewsAPITool
 from datetime import datetime
 
 class ContentRetrieverAgent:
-    def __init__(self):
-        self.news_tool = NewsAPITool()
+    def __init__(self, news_tool: Optional[NewsAPITool] = None):
+        self.news_tool = news_tool or NewsAPITool()
         
-    def process(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def process(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Fetch news articles for a given category"""
         category = state.get("category")
         if not category:
@@ -17,7 +17,7 @@ class ContentRetrieverAgent:
             }
         
         # Fetch articles from both APIs
-        articles = self.news_tool.fetch_all_news(category)
+        articles = await self.news_tool.fetch_all_news(category)
         
         return {
             **state,
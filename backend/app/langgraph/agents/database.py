@@ -1,12 +1,20 @@
 from typing import Dict, Any, List
 from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from app.models.news import News
-from app.database import SessionLocal
+from app.models.article_signature import ArticleSignature, ArticleBand
+from app.utils.minhash import band_keys, decode_signature
+from app.utils.search import unindex_urls, index_urls
+from app.utils.broadcast import news_broadcaster
+from app.utils.etag import bump_versions, news_version, NEWS_VERSION
+from app.response_schemas import NewsSchema, schema_columns, serialize_many
+from app.database import open_session, write_queue
 import json
 
 class DatabaseAgent:
     def __init__(self):
-        pass
+        self.columns = schema_columns(News, NewsSchema)
 
     def _extract_sentiment(self, sentiment_str: str) -> str:
         """Extract clean sentiment value from potential JSON string"""
@@ -18,50 +26,131 @@ class DatabaseAgent:
                 return "neutral"
         return sentiment_str
 
+    async def filter_known(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop articles whose URL is already saved and processed, before any LLM work"""
+        articles = state.get("articles", [])
+        urls = [article.get("url") for article in articles if article.get("url")]
+
+        if not urls:
+            return state
+
+        async with open_session() as db:
+            result = await db.execute(select(News.url).where(
+                News.url.in_(urls),
+                News.processing_status == "completed"
+            ))
+            known_urls = set(result.scalars().all())
+
+        new_articles = [article for article in articles if article.get("url") not in known_urls]
+
+        return {
+            **state,
+            "articles": new_articles,
+            "skipped_count": len(articles) - len(new_articles)
+        }
+
+    def _to_row(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "title": article.get("title"),
+            "summary": article.get("summary"),
+            "image_url": article.get("image_url"),
+            "url": article.get("url"),
+            "published_at": datetime.fromisoformat(article.get("published_at")),
+            "sentiment": self._extract_sentiment(article.get("sentiment", "neutral")),
+            "source": article.get("source", "unknown"),
+            "category": article.get("category", "general"),
+            # Articles whose LLM step failed are kept out of /news and retried by the next run
+            "processing_status": "failed" if article.get("error") else "completed",
+            "canonical_url": article.get("canonical_url")
+        }
+
+    def _with_duplicates(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Enriched articles plus their near-duplicates, which take over the canonical's sentiment, summary and failure"""
+        articles = state.get("articles", [])
+        enriched = {article.get("url"): article for article in articles}
+
+        duplicates = []
+        for duplicate in state.get("duplicates", []):
+            canonical = enriched.get(duplicate.get("canonical_url"))
+            if canonical is not None:
+                duplicate = {
+                    **duplicate,
+                    "sentiment": canonical.get("sentiment", "neutral"),
+                    "summary": canonical.get("summary")
+                }
+                if canonical.get("error"):
+                    duplicate["error"] = canonical["error"]
+            duplicates.append(duplicate)
+
+        return articles + duplicates
+
+    async def _publish(self, urls: List[str]) -> None:
+        """Push the saved articles to /news/stream listeners, if there are any"""
+        if not news_broadcaster.has_subscribers:
+            return
+        async with open_session() as db:
+            result = await db.execute(select(*self.columns).where(News.url.in_(urls)))
+            news_broadcaster.publish(serialize_many(NewsSchema, result.all()))
+
     async def process(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Save processed articles to database"""
-        articles = state.get("articles", [])
+        articles = self._with_duplicates(state)
         
         if not articles:
-            return {
-                **state,
-                "error": "No articles to save",
-                "status": "failed"
-            }
+            return {**state, "saved_count": 0}
 
-        db = SessionLocal()
         try:
-            for article in articles:
-                news_item = News(
-                    title=article.get("title"),
-                    summary=article.get("summary"),
-                    image_url=article.get("image_url"),
-                    url=article.get("url"),
-                    published_at=datetime.fromisoformat(article.get("published_at")),
-                    sentiment=self._extract_sentiment(article.get("sentiment", "neutral")),
-                    source=article.get("source", "unknown"),
-                    category=article.get("category", "general"),
-                    processing_status="completed"
-                )
-                db.merge(news_item)
-            
-            db.commit()
+            # One row per URL, since ON CONFLICT cannot update the same row twice in a statement
+            rows = list({article["url"]: self._to_row(article) for article in articles if article.get("url")}.values())
+
+            statement = insert(News).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[News.url],
+                set_={
+                    column: statement.excluded[column]
+                    for column in rows[0] if column != "url"
+                }
+            )
+
+            now = datetime.now()
+            signatures = {article["url"]: article["signature"] for article in articles if article.get("signature")}
+
+            urls = [row["url"] for row in rows]
+
+            async def save(db):
+                # Keep the search index in step with the rows in the same transaction
+                await db.execute(unindex_urls(urls))
+                await db.execute(statement)
+                await db.execute(index_urls(urls))
+                # Invalidates the /news and /bookmarks ETags clients poll with
+                await db.execute(bump_versions(NEWS_VERSION))
+                if signatures:
+                    # Record canonical articles so later syndicated copies can be matched to them
+                    await db.execute(insert(ArticleSignature).values([
+                        {"url": url, "signature": value, "created_at": now} for url, value in signatures.items()
+                    ]).on_conflict_do_nothing(index_elements=["url"]))
+                    await db.execute(insert(ArticleBand).values([
+                        {"bucket": bucket, "url": url}
+                        for url, value in signatures.items() for bucket in band_keys(decode_signature(value))
+                    ]).on_conflict_do_nothing(index_elements=["bucket", "url"]))
+
+            # Ingestion writes are serialized so they never contend with each other for the SQLite lock
+            await write_queue.submit(save)
+            news_version.invalidate()
+            await self._publish(urls)
             
             return {
                 **state,
-                "saved_count": len(articles),
+                "saved_count": len(rows),
                 "status": "success",
                 "timestamp": datetime.now().isoformat()
             }
 
         except Exception as e:
             print(f"Database error: {str(e)}")
-            db.rollback()
             return {
                 **state,
                 "error": str(e),
                 "status": "failed",
                 "timestamp": datetime.now().isoformat()
-            }
-        finally:
-            db.close()
\ No newline at end of file
+            }
\ No newline at end of file
@@ -0,0 +1,103 @@
+from typing import Dict, Any, List
+from datetime import datetime, timedelta
+from sqlalchemy import select, delete
+from app.database import open_session, write_queue
+from app.models.article_signature import ArticleSignature, ArticleBand
+from app.models.news import News
+from app.utils.minhash import MinHashIndex, shingles, signature, band_keys, encode_signature, decode_signature
+
+class DeduplicatorAgent:
+    """Links syndicated copies of a story to one canonical article so only that one is enriched"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.threshold = config.get("dedupe_threshold", 0.6)
+        self.window = timedelta(days=config.get("dedupe_window_days", 7))
+
+    async def _load_candidates(self, buckets: List[str]) -> MinHashIndex:
+        """Index the recent canonical articles that share an LSH bucket with this batch"""
+        index = MinHashIndex(self.threshold)
+        if not buckets:
+            return index
+
+        async with open_session() as db:
+            result = await db.execute(
+                select(ArticleSignature.url, ArticleSignature.signature)
+                .join(ArticleBand, ArticleBand.url == ArticleSignature.url)
+                .where(
+                    ArticleBand.bucket.in_(buckets),
+                    ArticleSignature.created_at >= datetime.now() - self.window
+                )
+                .distinct()
+            )
+            for url, value in result.all():
+                index.add(url, decode_signature(value))
+        return index
+
+    async def _load_enrichment(self, urls: List[str]) -> Dict[str, Any]:
+        if not urls:
+            return {}
+        async with open_session() as db:
+            result = await db.execute(select(News.url, News.sentiment, News.summary).where(
+                News.url.in_(urls),
+                News.processing_status == "completed"
+            ))
+            return {row.url: row for row in result.all()}
+
+    async def _prune(self) -> None:
+        cutoff = datetime.now() - self.window
+
+        async def prune(db):
+            expired = select(ArticleSignature.url).where(ArticleSignature.created_at < cutoff)
+            await db.execute(delete(ArticleBand).where(ArticleBand.url.in_(expired)))
+            await db.execute(delete(ArticleSignature).where(ArticleSignature.created_at < cutoff))
+
+        try:
+            await write_queue.submit(prune)
+        except Exception as e:
+            print(f"Signature pruning error: {str(e)}")
+
+    async def process(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Split articles into canonicals to enrich and near-duplicates that reuse a canonical's enrichment"""
+        articles = state.get("articles", [])
+        if not articles:
+            return state
+
+        signatures = [signature(shingles(article.get("title"), article.get("description"))) for article in articles]
+        known = await self._load_candidates(sorted({bucket for sig in signatures for bucket in band_keys(sig)}))
+
+        matches = [known.find(sig) if sig else None for sig in signatures]
+        enrichment = await self._load_enrichment([url for url in set(matches) if url])
+
+        batch = MinHashIndex(self.threshold)
+        canonicals, duplicates = [], []
+        for article, sig, match in zip(articles, signatures, matches):
+            url = article.get("url")
+            stored = enrichment.get(match) if match != url else None
+            if stored is not None:
+                duplicates.append({
+                    **article,
+                    "sentiment": stored.sentiment,
+                    "summary": stored.summary,
+                    "canonical_url": stored.url
+                })
+                continue
+
+            # Copies within this batch are filled in from their canonical when saving
+            in_batch = batch.find(sig) if sig else None
+            if in_batch is not None and in_batch != url:
+                duplicates.append({**article, "canonical_url": in_batch})
+                continue
+
+            if sig and url:
+                batch.add(url, sig)
+                article = {**article, "signature": encode_signature(sig)}
+            canonicals.append(article)
+
+        await self._prune()
+
+        return {
+            **state,
+            "articles": canonicals,
+            "duplicates": duplicates,
+            "duplicate_count": len(duplicates)
+        }
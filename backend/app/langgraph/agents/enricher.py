@@ -0,0 +1,210 @@
+from typing import Dict, Any, List, Literal, Optional
+import asyncio
+import httpx
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, Field, ValidationError
+from datetime import datetime
+from app.utils.concurrency import gather_bounded, SingleFlight
+from app.utils.enrichment_cache import EnrichmentCache
+from app.utils.metrics import invoke_llm
+from .analyzer import SentimentAnalyzerAgent
+from .summarizer import SummarizerAgent
+import json
+
+# Bump whenever BATCH_ENRICHMENT_PROMPT changes so cached results are not reused
+BATCH_ENRICHMENT_PROMPT_VERSION = "1"
+
+BATCH_ENRICHMENT_PROMPT = """Analyze and summarize each of the following news articles. For every article:
+1. Determine the overall tone (positive, negative, neutral) based on the emotional weight and implications of the content.
+2. Create a clear, concise summary (2-3 sentences) that maintains factual accuracy, includes key points and implications, and keeps the tone consistent with the original.
+
+{articles}
+
+Provide the results in the following JSON format, with exactly one entry per article and the same index as above:
+{{
+    "results": [
+        {{"index": 0, "sentiment": "positive/negative/neutral", "summary": "..."}}
+    ]
+}}
+"""
+
+class EnrichmentResult(BaseModel):
+    index: int = Field(..., ge=0)
+    sentiment: Literal["positive", "negative", "neutral"]
+    summary: str = Field(..., min_length=1)
+
+class BatchEnrichmentAgent:
+    """Returns sentiment and summary for several articles in a single LLM call"""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        sentiment_analyzer: SentimentAnalyzerAgent,
+        summarizer: SummarizerAgent,
+        cache: Optional[EnrichmentCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[asyncio.Semaphore] = None
+    ):
+        self.config = config
+        self.cache = cache
+        self.llm = ChatOpenAI(
+            model=config.get("model_name", "gpt-4o-mini"),
+            temperature=0.2,
+            api_key=config.get("openai_api_key"),
+            model_kwargs={"response_format": {"type": "json_object"}},
+            http_async_client=http_client
+        )
+        self.prompt = ChatPromptTemplate.from_template(BATCH_ENRICHMENT_PROMPT)
+        self.batch_size = max(1, config.get("enrichment_batch_size", 8))
+        self.max_concurrency = config.get("max_concurrency", 5)
+        self.limiter = limiter or asyncio.Semaphore(self.max_concurrency)
+        self.in_flight = SingleFlight()
+        # Used for articles the batch response did not cover
+        self.sentiment_analyzer = sentiment_analyzer
+        self.summarizer = summarizer
+
+    def _format_articles(self, articles: List[Dict[str, Any]]) -> str:
+        return "\n\n".join(
+            f"Article {index}:\nTitle: {article.get('title', '')}\nDescription: {article.get('description', '')}"
+            for index, article in enumerate(articles)
+        )
+
+    def _parse_results(self, content: str, count: int) -> Dict[int, EnrichmentResult]:
+        """Validate the response and index the usable entries by article position"""
+        if content.startswith("```"):
+            content = "\n".join(content.split("\n")[1:-1])
+
+        data = json.loads(content)
+        items = data.get("results", []) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            raise ValueError("Batch response does not contain a results list")
+
+        results = {}
+        for item in items:
+            try:
+                result = EnrichmentResult.model_validate(item)
+            except ValidationError:
+                continue
+            if result.index < count and result.index not in results:
+                results[result.index] = result
+        return results
+
+    async def _fallback(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        analyzed_article = await self.sentiment_analyzer.analyze_article(article)
+        return await self.summarizer.summarize_article(analyzed_article)
+
+    def _cache_key(self, article: Dict[str, Any]) -> str:
+        return self.cache.make_key(
+            "enrichment",
+            BATCH_ENRICHMENT_PROMPT_VERSION,
+            self.config.get("model_name", "gpt-4o-mini"),
+            article.get("title", ""),
+            article.get("description", "")
+        )
+
+    def _flight_key(self, article: Dict[str, Any]) -> Any:
+        if self.cache:
+            return self._cache_key(article)
+        return ("enrichment", article.get("title", ""), article.get("description", ""))
+
+    async def _enrich_owned(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """One LLM call for the articles this batch is responsible for"""
+        results = {}
+        try:
+            messages = self.prompt.format_messages(articles=self._format_articles(articles))
+            # Shared with every other LLM call of the graph, across categories
+            async with self.limiter:
+                response = await invoke_llm(self.llm, messages, "enricher")
+            results = self._parse_results(response.content, len(articles))
+        except Exception as e:
+            print(f"Error enriching article batch: {str(e)}")
+
+        enriched = []
+        for position, article in enumerate(articles):
+            result = results.get(position)
+            if result:
+                enriched.append({
+                    **article,
+                    "sentiment": result.sentiment,
+                    "summary": result.summary
+                })
+                if self.cache:
+                    await self.cache.set(
+                        self._cache_key(article),
+                        "enrichment",
+                        json.dumps({"sentiment": result.sentiment, "summary": result.summary})
+                    )
+            else:
+                enriched.append(await self._fallback(article))
+        return enriched
+
+    async def enrich_batch(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich a batch of articles, falling back per article for missing or malformed entries"""
+        enriched: Dict[int, Dict[str, Any]] = {}
+        owned, shared = [], []
+
+        for index, article in enumerate(articles):
+            cached = await self.cache.get(self._cache_key(article)) if self.cache else None
+            if cached is not None:
+                enriched[index] = {**article, **json.loads(cached)}
+                continue
+
+            # An article another category is already enriching is waited for, not sent again
+            future = self.in_flight.claim(self._flight_key(article))
+            if future is None:
+                owned.append(index)
+            else:
+                shared.append((index, future))
+
+        if owned:
+            try:
+                results = await self._enrich_owned([articles[index] for index in owned])
+            except BaseException as e:
+                for index in owned:
+                    self.in_flight.resolve(self._flight_key(articles[index]), error=RuntimeError(str(e)))
+                raise
+
+            for index, result in zip(owned, results):
+                enriched[index] = result
+                if result.get("error"):
+                    # Waiters retry on their own rather than copying a failed enrichment
+                    self.in_flight.resolve(self._flight_key(articles[index]), error=RuntimeError(result["error"]))
+                    continue
+                self.in_flight.resolve(
+                    self._flight_key(articles[index]),
+                    {"sentiment": result.get("sentiment"), "summary": result.get("summary")}
+                )
+
+        for index, future in shared:
+            try:
+                enriched[index] = {**articles[index], **await asyncio.shield(future)}
+            except Exception:
+                enriched[index] = await self._fallback(articles[index])
+
+        return [enriched[index] for index in range(len(articles))]
+
+    async def process(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze and summarize articles in batches"""
+        articles = state.get("articles", [])
+
+        # Nothing new since the last run is the normal idle case, not a failure
+        if not articles:
+            return state
+
+        batches = [articles[i:i + self.batch_size] for i in range(0, len(articles), self.batch_size)]
+        results = await gather_bounded(batches, self.enrich_batch, self.max_concurrency)
+
+        enriched_articles = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                result = [{**article, "sentiment": "unknown", "summary": "", "error": str(result)} for article in batch]
+            enriched_articles.extend(result)
+
+        return {
+            **state,
+            "articles": enriched_articles,
+            "enriched_count": len(enriched_articles),
+            "status": "success",
+            "timestamp": datetime.now().isoformat()
+        }
@@ -1,9 +1,15 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import asyncio
+import httpx
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from datetime import datetime
-from app.models.news import News
-from app.database import SessionLocal
+from app.utils.concurrency import gather_bounded, SingleFlight
+from app.utils.enrichment_cache import EnrichmentCache
+from app.utils.metrics import invoke_llm
+
+# Bump whenever SUMMARIZER_PROMPT changes so cached results are not reused
+SUMMARIZER_PROMPT_VERSION = "1"
 
 SUMMARIZER_PROMPT = """Summarize the following news article concisely while maintaining key information.
 
@@ -22,32 +28,76 @@ Provide the summary in a clear, readable format.
 """
 
 class SummarizerAgent:
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        cache: Optional[EnrichmentCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[asyncio.Semaphore] = None
+    ):
         self.config = config
+        self.cache = cache
         self.llm = ChatOpenAI(
             model=config.get("model_name", "gpt-4o-mini"),
             temperature=0.3,
-            api_key=config.get("openai_api_key")
+            api_key=config.get("openai_api_key"),
+            http_async_client=http_client
         )
         self.prompt = ChatPromptTemplate.from_template(SUMMARIZER_PROMPT)
+        self.max_concurrency = config.get("max_concurrency", 5)
+        self.limiter = limiter or asyncio.Semaphore(self.max_concurrency)
+        self.in_flight = SingleFlight()
+
+    async def _summary(self, article: Dict[str, Any], cache_key: Optional[str]) -> str:
+        if cache_key:
+            cached_summary = await self.cache.get(cache_key)
+            if cached_summary is not None:
+                return cached_summary
+
+        messages = self.prompt.format_messages(
+            title=article.get("title", ""),
+            description=article.get("description", ""),
+            sentiment=article.get("sentiment", "neutral")
+        )
+
+        # Shared with every other LLM call of the graph, across categories
+        async with self.limiter:
+            response = await invoke_llm(self.llm, messages, "summarizer")
+
+        if cache_key:
+            await self.cache.set(cache_key, "summary", response.content)
+        return response.content
 
     async def summarize_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """Generate summary for a single article"""
         try:
-                
-            messages = self.prompt.format_messages(
-                title=article.get("title", ""),
-                description=article.get("description", ""),
-                sentiment=article.get("sentiment", "neutral")
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.make_key(
+                    "summary",
+                    SUMMARIZER_PROMPT_VERSION,
+                    self.config.get("model_name", "gpt-4o-mini"),
+                    article.get("title", ""),
+                    article.get("description", ""),
+                    article.get("sentiment", "neutral")
+                )
+
+            # The same article arriving from several categories at once is summarized once
+            summary = await self.in_flight.run(
+                cache_key or (
+                    "summary",
+                    article.get("title", ""),
+                    article.get("description", ""),
+                    article.get("sentiment", "neutral")
+                ),
+                lambda: self._summary(article, cache_key)
             )
-            
-            response = await self.llm.ainvoke(messages)
-            
+
             return {
                 **article,
-                "summary": response.content
+                "summary": summary
             }
-            
+
         except Exception as e:
             print(f"Error summarizing article: {str(e)}")
             return {
@@ -60,19 +110,17 @@ class SummarizerAgent:
         """Process and summarize articles"""
         articles = state.get("articles", [])
         
+        # Nothing new since the last run is the normal idle case, not a failure
         if not articles:
-            return {
-                **state,
-                "error": "No articles to summarize",
-                "status": "failed"
-            }
+            return state
 
-        summarized_articles = []
-        
-        # Process each article
-        for article in articles:
-            summarized_article = await self.summarize_article(article)
-            summarized_articles.append(summarized_article)
+        # Summarize articles concurrently, keeping their order
+        results = await gather_bounded(articles, self.summarize_article, self.max_concurrency)
+        summarized_articles = [
+            result if not isinstance(result, BaseException)
+            else {**article, "summary": "", "error": str(result)}
+            for article, result in zip(articles, results)
+        ]
 
         return {
             **state,
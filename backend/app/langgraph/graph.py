@@ -1,30 +1,77 @@
 from langgraph.graph import Graph
-from langgraph.constants import START
+from langgraph.constants import START, END
 from .agents.content_retriever import ContentRetrieverAgent
+from .tools.content_tools import NewsAPITool
 from .agents.analyzer import SentimentAnalyzerAgent
 from .agents.summarizer import SummarizerAgent
+from .agents.enricher import BatchEnrichmentAgent
 from .agents.database import DatabaseAgent
-from typing import Dict, Any
+from .agents.deduplicator import DeduplicatorAgent
+from app.utils.enrichment_cache import EnrichmentCache
+from app.utils.metrics import registry, timed_node
+from typing import Dict, Any, Optional
+import asyncio
+import httpx
 
-def create_news_processing_graph(config: Dict[str, Any]) -> Graph:
-    # Initialize agents
-    content_retriever = ContentRetrieverAgent()
-    sentiment_analyzer = SentimentAnalyzerAgent(config)
-    summarizer = SummarizerAgent(config)
+def create_news_processing_graph(
+    config: Dict[str, Any],
+    llm_client: Optional[httpx.AsyncClient] = None,
+    provider_client: Optional[httpx.AsyncClient] = None
+) -> Graph:
+    # Initialize agents; the LLM agents share one connection pool, the news tool another
+    content_retriever = ContentRetrieverAgent(NewsAPITool(client=provider_client))
+    # One budget for in-flight LLM calls across all agents and all categories running at once
+    llm_limiter = asyncio.Semaphore(config.get("max_concurrency", 5))
+    # Shared by the LLM agents so repeated articles skip the model entirely
+    enrichment_cache = EnrichmentCache(
+        ttl_seconds=config.get("enrichment_cache_ttl_seconds", 30 * 24 * 3600),
+        max_entries=config.get("enrichment_cache_max_entries", 50000)
+    )
+    registry.register_cache("enrichment", enrichment_cache)
+    sentiment_analyzer = SentimentAnalyzerAgent(
+        config, cache=enrichment_cache, http_client=llm_client, limiter=llm_limiter
+    )
+    summarizer = SummarizerAgent(
+        config, cache=enrichment_cache, http_client=llm_client, limiter=llm_limiter
+    )
     database = DatabaseAgent()
     # Create graph
     workflow = Graph()
     
     # Add nodes
-    workflow.add_node("retrieve", content_retriever.process)
-    workflow.add_node("analyze_sentiment", sentiment_analyzer.process)
-    workflow.add_node("summarize", summarizer.process)
-    workflow.add_node("save_to_db", database.process)
-    
-    # Add edges
+    workflow.add_node("retrieve", timed_node("retrieve", content_retriever.process))
+    workflow.add_node("prefilter", timed_node("prefilter", database.filter_known))
+    workflow.add_node("save_to_db", timed_node("save_to_db", database.process))
+
     workflow.add_edge(START, "retrieve")  # Add entry point
-    workflow.add_edge("retrieve", "analyze_sentiment")
-    workflow.add_edge("analyze_sentiment", "summarize")
-    workflow.add_edge("summarize", "save_to_db")
+    workflow.add_edge("retrieve", "prefilter")  # Skip articles that are already processed
+    enrich_from = "prefilter"
+
+    if config.get("dedupe_enabled", True):
+        # Syndicated copies reuse their canonical article's enrichment instead of calling the LLM
+        workflow.add_node("dedupe", timed_node("dedupe", DeduplicatorAgent(config).process))
+        workflow.add_edge("prefilter", "dedupe")
+        enrich_from = "dedupe"
+
+    if config.get("enrichment_mode", "separate") == "batched":
+        # One LLM call returns sentiment and summary for a whole batch of articles
+        enricher = BatchEnrichmentAgent(
+            config, sentiment_analyzer, summarizer,
+            cache=enrichment_cache, http_client=llm_client, limiter=llm_limiter
+        )
+        workflow.add_node("enrich", timed_node("enrich", enricher.process))
+
+        workflow.add_edge(enrich_from, "enrich")
+        workflow.add_edge("enrich", "save_to_db")
+    else:
+        workflow.add_node("analyze_sentiment", timed_node("analyze_sentiment", sentiment_analyzer.process))
+        workflow.add_node("summarize", timed_node("summarize", summarizer.process))
+
+        # Add edges
+        workflow.add_edge(enrich_from, "analyze_sentiment")
+        workflow.add_edge("analyze_sentiment", "summarize")
+        workflow.add_edge("summarize", "save_to_db")
+
+    workflow.add_edge("save_to_db", END)  # Return the final state from ainvoke
 
-    return workflow.compile()
\ No newline at end of file
+    return workflow.compile()
@@ -1,92 +1,54 @@
-from typing import Dict, Any, List
-import requests
+from typing import Dict, Any, List, Optional
+import asyncio
+import httpx
 from decouple import config
+from .providers import NewsProvider, MediaStackProvider, NewsAPIProvider, create_provider_client
+from .rss import RSSProvider
+
+PROVIDERS = {
+    "mediastack": MediaStackProvider,
+    "newsapi": NewsAPIProvider,
+    "rss": RSSProvider,
+}
+
+def create_providers(client: httpx.AsyncClient, limiter: asyncio.Semaphore) -> List[NewsProvider]:
+    """The providers named in news_providers; rss is only added when rss_feeds lists any feed"""
+    names = [name.strip().lower() for name in config("news_providers", default="mediastack,newsapi,rss").split(",") if name.strip()]
+    if not config("rss_feeds", default="").strip():
+        names = [name for name in names if name != "rss"]
+    return [PROVIDERS[name](client, limiter) for name in names]
 
 class NewsAPITool:
-    """Tool for fetching news content from NewsAPI and MediaStack"""
-    
-    def __init__(self):
-        self.news_api_key = config("news_api_key")
-        self.mediastack_api_key = config("media_stack_api_key")
-
-    def fetch_from_mediastack(self, category: str) -> List[Dict[str, Any]]:
-        """Fetch news from MediaStack API for a given category"""
-
-        url = "http://api.mediastack.com/v1/news"
-        params = {
-            "access_key": self.mediastack_api_key,
-            "categories": category,
-            "limit": 2,
-            "sort": "published_desc",
-            "sources": "en,-de"
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            print(f"MediaStack response: {len(response.json()['data'])}")
-
-            if response.status_code == 200:
-                data = response.json()
-                return [{
-                    "title": item.get("title"),
-                    "description": item.get("description"),
-                    "url": item.get("url"),
-                    "image_url": item.get("image"),
-                    "published_at": item.get("published_at"),
-                    "source": item.get("source"),
-                    "category": category,
-                } for item in data.get("data", [])]
-            return []
-        except Exception as e:
-            print(f"MediaStack API error: {e}")
-            return []
-
-    def fetch_from_newsapi(self, category: str) -> List[Dict[str, Any]]:
-        """Fetch news from NewsAPI for a given category"""   
-     
-        url = "https://newsapi.org/v2/everything"
-        params = {
-            "apiKey": self.news_api_key,
-            "q": category,
-            "pageSize": 2,
-            "sortBy": "publishedAt"
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            print(f"NewsAPI response: {len(response.json()['articles'])}")
+    """Tool for fetching news content from every configured provider"""
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[asyncio.Semaphore] = None,
+        providers: Optional[List[NewsProvider]] = None
+    ):
+        # One pooled client shared by every request so connections are kept alive
+        self.client = client or create_provider_client()
+        # Bounds provider requests across every category ingesting at the same time
+        self.limiter = limiter or asyncio.Semaphore(config("provider_max_concurrency", default=4, cast=int))
+        self.providers = providers if providers is not None else create_providers(self.client, self.limiter)
+
+    async def fetch_all_news(self, category: str) -> List[Dict[str, Any]]:
+        """Fetch news from every provider concurrently and combine results"""
+        fetches = [provider.fetch(category) for provider in self.providers]
+
+        # Merge each provider's results as soon as it answers, removing duplicates based on URL
+        seen_urls = set()
+        combined_news = []
 
-            if response.status_code == 200:
-                data = response.json()
-                return [{
-                    "title": item.get("title"),
-                    "description": item.get("description"),
-                    "url": item.get("url"),
-                    "image_url": item.get("urlToImage"),
-                    "published_at": item.get("publishedAt"),
-                    "source": item.get("source", {}).get("name"),
-                    "category": category,
-                } for item in data.get("articles", [])]
-            return []
-        except Exception as e:
-            print(f"NewsAPI error: {e}")
-            return []
+        for fetch in asyncio.as_completed(fetches):
+            for item in await fetch:
+                url = item.get("url")
+                if url and url not in seen_urls:
+                    seen_urls.add(url)
+                    combined_news.append(item)
 
-    def fetch_all_news(self, category: str) -> List[Dict[str, Any]]:
-        """Fetch news from both APIs and combine results"""
-        # Get news from both sources
+        return combined_news
 
-        mediastack_news = self.fetch_from_mediastack(category)
-        newsapi_news = self.fetch_from_newsapi(category)
-        
-        # Combine results and remove duplicates based on URL
-        seen_urls = set()
-        combined_news = []
-        
-        for item in mediastack_news + newsapi_news:
-            url = item.get("url")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                combined_news.append(item)
-        
-        return combined_news
\ No newline at end of file
+    async def aclose(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,137 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional
+import asyncio
+import random
+import time
+import httpx
+from decouple import config
+from app.utils.metrics import PROVIDER_DURATION, PROVIDER_RESPONSES
+
+# Statuses worth retrying: rate limiting and transient upstream failures
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+def create_provider_client() -> httpx.AsyncClient:
+    """Keep-alive client for the news providers"""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(config("provider_timeout_seconds", default=10.0, cast=float)),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    )
+
+class NewsProvider(ABC):
+    """A source of articles for a category, in the article dict shape the graph expects"""
+
+    name = "provider"
+
+    def __init__(self, client: httpx.AsyncClient, limiter: asyncio.Semaphore):
+        # Shared by every provider so connections are kept alive and requests are bounded overall
+        self.client = client
+        self.limiter = limiter
+        self.max_retries = config("provider_max_retries", default=2, cast=int)
+        self.backoff_seconds = config("provider_backoff_seconds", default=0.5, cast=float)
+        self.page_size = config("provider_page_size", default=20, cast=int)
+
+    @abstractmethod
+    async def fetch(self, category: str) -> List[Dict[str, Any]]:
+        """Articles for the category; an empty list when the source fails"""
+
+    async def _backoff(self, attempt: int) -> None:
+        await asyncio.sleep(random.uniform(0, self.backoff_seconds * 2 ** attempt))
+
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """GET a provider endpoint, retrying transient failures with jittered exponential backoff"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.limiter:
+                    started = time.perf_counter()
+                    try:
+                        response = await self.client.get(url, params=params)
+                    finally:
+                        PROVIDER_DURATION.observe(time.perf_counter() - started, self.name)
+                PROVIDER_RESPONSES.inc(self.name, str(response.status_code))
+                if response.status_code == 200:
+                    return response.json()
+                print(f"{self.name} returned status {response.status_code}")
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return None
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                PROVIDER_RESPONSES.inc(self.name, "error")
+                print(f"{self.name} request failed: {e!r}")
+
+            if attempt < self.max_retries:
+                await self._backoff(attempt)
+        return None
+
+class MediaStackProvider(NewsProvider):
+    name = "MediaStack"
+
+    def __init__(self, client: httpx.AsyncClient, limiter: asyncio.Semaphore):
+        super().__init__(client, limiter)
+        self.api_key = config("media_stack_api_key")
+        self.url = config("mediastack_url", default="http://api.mediastack.com/v1/news")
+
+    async def fetch(self, category: str) -> List[Dict[str, Any]]:
+        """Fetch news from MediaStack API for a given category"""
+
+        params = {
+            "access_key": self.api_key,
+            "categories": category,
+            "limit": self.page_size,
+            "sort": "published_desc",
+            "sources": "en,-de"
+        }
+
+        try:
+            data = await self._get_json(self.url, params)
+            if data is None:
+                return []
+
+            print(f"MediaStack response: {len(data.get('data', []))}")
+            return [{
+                "title": item.get("title"),
+                "description": item.get("description"),
+                "url": item.get("url"),
+                "image_url": item.get("image"),
+                "published_at": item.get("published_at"),
+                "source": item.get("source"),
+                "category": category,
+            } for item in data.get("data", [])]
+        except Exception as e:
+            print(f"MediaStack API error: {e}")
+            return []
+
+class NewsAPIProvider(NewsProvider):
+    name = "NewsAPI"
+
+    def __init__(self, client: httpx.AsyncClient, limiter: asyncio.Semaphore):
+        super().__init__(client, limiter)
+        self.api_key = config("news_api_key")
+        self.url = config("newsapi_url", default="https://newsapi.org/v2/everything")
+
+    async def fetch(self, category: str) -> List[Dict[str, Any]]:
+        """Fetch news from NewsAPI for a given category"""
+
+        params = {
+            "apiKey": self.api_key,
+            "q": category,
+            "pageSize": self.page_size,
+            "sortBy": "publishedAt"
+        }
+
+        try:
+            data = await self._get_json(self.url, params)
+            if data is None:
+                return []
+
+            print(f"NewsAPI response: {len(data.get('articles', []))}")
+            return [{
+                "title": item.get("title"),
+                "description": item.get("description"),
+                "url": item.get("url"),
+                "image_url": item.get("urlToImage"),
+                "published_at": item.get("publishedAt"),
+                "source": (item.get("source") or {}).get("name"),
+                "category": category,
+            } for item in data.get("articles", [])]
+        except Exception as e:
+            print(f"NewsAPI error: {e}")
+            return []
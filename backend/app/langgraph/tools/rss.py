@@ -0,0 +1,296 @@
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse, unquote
+from xml.etree import ElementTree
+import asyncio
+import html
+import os
+import re
+import time
+import httpx
+from decouple import config
+from app.utils.concurrency import SingleFlight
+from app.utils.metrics import PROVIDER_DURATION, PROVIDER_RESPONSES
+from .providers import NewsProvider, RETRYABLE_STATUS_CODES
+
+CHUNK_SIZE = 64 * 1024
+MAX_DESCRIPTION_LENGTH = 2000
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+# RSS 2.0 <item>, RSS 1.0 (RDF) <item> and Atom <entry>
+ENTRY_TAGS = {"item", "entry"}
+FEED_TAGS = {"channel", "feed"}
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+SPACE_PATTERN = re.compile(r"\s+")
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+def _text(value: Optional[str]) -> str:
+    """Plain text from a possibly HTML-escaped feed field"""
+    if not value:
+        return ""
+    return SPACE_PATTERN.sub(" ", html.unescape(TAG_PATTERN.sub(" ", value))).strip()[:MAX_DESCRIPTION_LENGTH]
+
+def _published_at(value: Optional[str]) -> Optional[str]:
+    """RFC 822 (RSS) or ISO 8601 (Atom, Dublin Core) date as an ISO string in UTC"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        published = parsedate_to_datetime(value) if not value[:4].isdigit() else datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc).isoformat()
+
+def parse_entry(item: ElementTree.Element, source: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Map an RSS item or Atom entry to the article dict shape, or None without a title and link"""
+    fields: Dict[str, str] = {}
+    tags: List[str] = []
+    link = image_url = None
+
+    for child in item:
+        name = _local(child.tag)
+        if child.tag.startswith(MEDIA_NS):
+            if name == "thumbnail" or (name == "content" and (child.get("medium") == "image" or (child.get("type") or "").startswith("image/"))):
+                image_url = image_url or child.get("url")
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                link = link or (child.text or "").strip()
+            elif child.get("rel", "alternate") == "alternate":
+                link = link or href
+        elif name == "enclosure":
+            if (child.get("type") or "").startswith("image/"):
+                image_url = image_url or child.get("url")
+        elif name == "guid":
+            if child.get("isPermaLink", "true") != "false":
+                fields.setdefault("guid", (child.text or "").strip())
+        elif name == "category":
+            tags.append((child.get("term") or child.text or "").strip().lower())
+        elif child.tag == ATOM_NS + "content" or name == "encoded":
+            fields.setdefault("content", child.text or "")
+        elif name == "source":
+            fields.setdefault("source", _text(child.text) or _text(child.findtext(ATOM_NS + "title")))
+        else:
+            fields.setdefault(name, child.text or "")
+
+    title = _text(fields.get("title"))
+    url = link or fields.get("guid") or fields.get("id")
+    if not title or not url:
+        return None
+
+    return {
+        "title": title,
+        "description": _text(fields.get("description") or fields.get("summary") or fields.get("content")),
+        "url": url,
+        "image_url": image_url,
+        "published_at": (
+            _published_at(fields.get("pubDate") or fields.get("published") or fields.get("date") or fields.get("updated"))
+            or datetime.now(timezone.utc).isoformat()
+        ),
+        "source": fields.get("source") or source,
+        "tags": tags,
+    }
+
+class FeedParser:
+    """Incremental RSS/Atom parser: entries are returned as soon as they close and then dropped from the tree"""
+
+    def __init__(self, source: Optional[str] = None):
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._stack: List[ElementTree.Element] = []
+        self.title: Optional[str] = None
+        self.source = source
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        entries = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                continue
+
+            self._stack.pop()
+            name = _local(element.tag)
+            if name in ENTRY_TAGS:
+                entry = parse_entry(element, self.title or self.source)
+                if entry is not None:
+                    entries.append(entry)
+                # Memory stays bounded by one entry rather than the whole document
+                if self._stack:
+                    self._stack[-1].remove(element)
+                element.clear()
+            elif name == "title" and self.title is None and self._stack and _local(self._stack[-1].tag) in FEED_TAGS:
+                self.title = _text(element.text) or None
+        return entries
+
+def parse_feeds_setting(value: str) -> List[Tuple[Optional[str], str]]:
+    """"technology=https://a/feed.xml, https://b/rss" -> [("technology", ...), (None, ...)]"""
+    feeds = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        match = re.match(r"^([\w-]+)=(.+)$", item)
+        feeds.append((match.group(1), match.group(2).strip()) if match else (None, item))
+    return feeds
+
+class RSSProvider(NewsProvider):
+    """RSS 2.0, RSS 1.0 and Atom feeds, from URLs or local files
+
+    A feed listed as category=url supplies that category; a bare url supplies every
+    category its entries mention (in their tags, title or description). Each feed is
+    downloaded at most once per min_poll_seconds, with conditional GETs so unchanged
+    feeds are neither transferred nor parsed. The last parsed entries are kept and
+    handed once to every category that asks for them, so a category polling after
+    the feed answered 304 still gets the entries an earlier category received.
+    """
+
+    name = "RSS"
+
+    def __init__(self, client: httpx.AsyncClient, limiter: asyncio.Semaphore, feeds: Optional[List[Tuple[Optional[str], str]]] = None):
+        super().__init__(client, limiter)
+        self.feeds = feeds if feeds is not None else parse_feeds_setting(config("rss_feeds", default=""))
+        self.min_poll_seconds = config("rss_min_poll_seconds", default=60, cast=float)
+        self.max_entries = config("rss_max_entries", default=5000, cast=int)
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # location -> (polled at, generation, last parsed entries); generation changes with each new document
+        self._polls: Dict[str, Tuple[float, int, List[Dict[str, Any]]]] = {}
+        # (location, category) -> generation last handed to that category
+        self._delivered: Dict[Tuple[str, str], int] = {}
+        self.in_flight = SingleFlight()
+
+    async def _parse(self, chunks: AsyncIterator[bytes], source: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """Entries of a streamed document, and whether it was read completely"""
+        parser = FeedParser(source)
+        entries: List[Dict[str, Any]] = []
+        try:
+            async for chunk in chunks:
+                entries.extend(parser.feed(chunk))
+                if len(entries) >= self.max_entries:
+                    return entries[:self.max_entries], True
+            entries.extend(parser.close())
+            return entries[:self.max_entries], True
+        except ElementTree.ParseError as e:
+            print(f"RSS parse error for {source}: {e}")
+            return entries[:self.max_entries], False
+
+    async def _read_file(self, path: str) -> Optional[List[Dict[str, Any]]]:
+        """Entries of a local feed, or None if it has not changed since the last read"""
+        # The file's mtime and size stand in for ETag / Last-Modified
+        stat = await asyncio.to_thread(os.stat, path)
+        validator = (str(stat.st_mtime_ns), str(stat.st_size))
+        if self._validators.get(path) == validator:
+            return None
+
+        handle = await asyncio.to_thread(open, path, "rb")
+        try:
+            async def chunks() -> AsyncIterator[bytes]:
+                while chunk := await asyncio.to_thread(handle.read, CHUNK_SIZE):
+                    yield chunk
+            entries, complete = await self._parse(chunks(), os.path.basename(path))
+        finally:
+            handle.close()
+        if complete:
+            self._validators[path] = validator
+        return entries
+
+    async def _download(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Conditional GET of a feed, streamed into the parser; None if unchanged or unavailable"""
+        etag, last_modified = self._validators.get(url, (None, None))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.limiter:
+                    started = time.perf_counter()
+                    try:
+                        async with self.client.stream("GET", url, headers=headers) as response:
+                            PROVIDER_RESPONSES.inc(self.name, str(response.status_code))
+                            if response.status_code == 304:
+                                return None
+                            if response.status_code == 200:
+                                entries, complete = await self._parse(response.aiter_bytes(), urlparse(url).hostname or url)
+                                if complete:
+                                    self._validators[url] = (response.headers.get("etag"), response.headers.get("last-modified"))
+                                return entries
+                    finally:
+                        PROVIDER_DURATION.observe(time.perf_counter() - started, self.name)
+                print(f"RSS feed {url} returned status {response.status_code}")
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return None
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                PROVIDER_RESPONSES.inc(self.name, "error")
+                print(f"RSS feed {url} request failed: {e!r}")
+
+            if attempt < self.max_retries:
+                await self._backoff(attempt)
+        return None
+
+    async def _poll(self, location: str) -> Tuple[float, int, List[Dict[str, Any]]]:
+        try:
+            if "://" not in location or location.startswith("file://"):
+                entries = await self._read_file(unquote(urlparse(location).path) if location.startswith("file://") else location)
+            else:
+                entries = await self._download(location)
+        except Exception as e:
+            print(f"RSS feed {location} error: {e}")
+            entries = None
+
+        _, generation, previous = self._polls.get(location, (0.0, 0, []))
+        # Unchanged or unavailable: keep the last entries for the categories that have not had them yet
+        polled = (time.monotonic(), generation, previous) if entries is None else (time.monotonic(), generation + 1, entries)
+        self._polls[location] = polled
+        return polled
+
+    async def _entries(self, location: str, category: str) -> List[Dict[str, Any]]:
+        """The feed's latest entries if this category has not received them yet, polling at most once per min_poll_seconds"""
+        polled = self._polls.get(location)
+        if not polled or time.monotonic() - polled[0] >= self.min_poll_seconds:
+            polled = await self.in_flight.run(location, lambda: self._poll(location))
+
+        _, generation, entries = polled
+        if self._delivered.get((location, category)) == generation:
+            return []
+        self._delivered[(location, category)] = generation
+        return entries
+
+    def _mentions(self, entry: Dict[str, Any], category: str) -> bool:
+        needle = category.lower()
+        if needle in entry["tags"]:
+            return True
+        return re.search(rf"\b{re.escape(needle)}\b", f"{entry['title']} {entry['description']}".lower()) is not None
+
+    async def fetch(self, category: str) -> List[Dict[str, Any]]:
+        """Entries of the feeds assigned to this category, plus matching entries of the shared feeds"""
+        feeds = [(feed_category, location) for feed_category, location in self.feeds if feed_category in (None, category)]
+        results = await asyncio.gather(*(self._entries(location, category) for _, location in feeds))
+
+        articles = []
+        for (feed_category, _), entries in zip(feeds, results):
+            for entry in entries:
+                if feed_category is None and not self._mentions(entry, category):
+                    continue
+                article = {key: value for key, value in entry.items() if key != "tags"}
+                article["category"] = category
+                articles.append(article)
+
+        if feeds:
+            print(f"RSS response: {len(articles)}")
+        return articles
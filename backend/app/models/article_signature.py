@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime, Text
+from app.database import Base
+
+class ArticleSignature(Base):
+    __tablename__ = "article_signatures"
+
+    url = Column(String, primary_key=True)
+    signature = Column(Text)
+    created_at = Column(DateTime, index=True)
+
+class ArticleBand(Base):
+    __tablename__ = "article_bands"
+
+    bucket = Column(String, primary_key=True)
+    url = Column(String, primary_key=True, index=True)
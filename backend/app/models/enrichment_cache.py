@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime, Text
+from app.database import Base
+
+class EnrichmentCacheEntry(Base):
+    __tablename__ = "enrichment_cache"
+
+    key = Column(String, primary_key=True)
+    kind = Column(String)
+    value = Column(Text)
+    created_at = Column(DateTime, index=True)
+    last_accessed_at = Column(DateTime, index=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -7,7 +7,8 @@ user_interests = Table(
     'user_interests',
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id')),
-    Column('interest_id', Integer, ForeignKey('interests.id'))
+    Column('interest_id', Integer, ForeignKey('interests.id')),
+    Index('ux_user_interests_user_interest', 'user_id', 'interest_id', unique=True)
 )
 
 class Interest(Base):
@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from app.database import Base
 
 class News(Base):
     __tablename__ = "news"
+    __table_args__ = (
+        # Serve the feed filters and keyset pagination on (published_at, id) from the index
+        Index("ix_news_category_status_published", "category", "processing_status", "published_at"),
+        Index("ix_news_status_published", "processing_status", "published_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     summary = Column(Text)
@@ -13,3 +19,5 @@ class News(Base):
     source = Column(String)
     category = Column(String)
     processing_status = Column(String, default="pending")
+    # Set on near-duplicates (syndicated copies) to the article whose enrichment they reuse
+    canonical_url = Column(String, nullable=True)
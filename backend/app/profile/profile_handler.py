@@ -1,8 +1,41 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
-from app.models.interest import Interest
+from app.models.interest import user_interests
+from app.utils.interest_catalog import interest_catalog
 
-async def create_user_profile(user_id: int, interest_ids: list[int], db: Session):
+async def set_user_interests(user_id: int, interest_ids: list[int], db: AsyncSession):
+    """
+    Replace a user's interests by diffing against user_interests
+
+    Unknown interest IDs are ignored. Removed pairs are deleted with one statement
+    and added pairs inserted with one statement.
+    """
+    catalog = await interest_catalog.get()
+    wanted = {interest_id for interest_id in interest_ids if interest_id in catalog.by_id}
+
+    result = await db.execute(
+        select(user_interests.c.interest_id).where(user_interests.c.user_id == user_id)
+    )
+    current = set(result.scalars().all())
+
+    removed = current - wanted
+    added = wanted - current
+
+    if removed:
+        await db.execute(delete(user_interests).where(
+            user_interests.c.user_id == user_id,
+            user_interests.c.interest_id.in_(removed)
+        ))
+    if added:
+        await db.execute(
+            insert(user_interests),
+            [{"user_id": user_id, "interest_id": interest_id} for interest_id in added]
+        )
+
+    await db.commit()
+
+async def create_user_profile(user_id: int, interest_ids: list[int], db: AsyncSession):
     """
     Create user profile by setting interests and marking user as onboarded
     
@@ -15,24 +48,13 @@ async def create_user_profile(user_id: int, interest_ids: list[int], db: Session
         Updated user object if successful, None if user not found
     """
     # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         return None
         
-    # Clear any existing interests
-    user.interests = []
-    
-    # Add selected interests
-    for interest_id in interest_ids:
-        interest = db.query(Interest).filter(Interest.id == interest_id).first()
-        if interest:
-            user.interests.append(interest)
+    await set_user_interests(user_id, interest_ids, db)
     
     # Mark user as onboarded
     user.onboarded = True
     
-    # Commit changes
-    db.commit()
-    db.refresh(user)
-    
     return user
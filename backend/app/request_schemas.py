@@ -37,4 +37,13 @@ class UserInterestsCreateUpdateSchema(BaseModel):
             "example": {
                 "interest_ids": [1, 2, 3]
             }
-        }
\ No newline at end of file
+        }
+class BookmarksBulkSchema(BaseModel):
+    news_ids: list[int] = Field(..., max_length=1000, description="List of news IDs")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "news_ids": [1, 2, 3]
+            }
+        }
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
+
+class InterestSchema(BaseModel):
+    id: int = Field(..., description="The ID of the interest")
+    name: str = Field(..., description="The name of the interest category")
+
+    class Config:
+        from_attributes = True
+
+class UserSchema(BaseModel):
+    id: int = Field(..., description="The ID of the user")
+    firstname: Optional[str] = Field(None, description="The first name of the user")
+    lastname: Optional[str] = Field(None, description="The last name of the user")
+    email: str = Field(..., description="The email address of the user")
+
+    class Config:
+        from_attributes = True
+
+class NewsSchema(BaseModel):
+    id: int = Field(..., description="The ID of the article")
+    title: Optional[str] = Field(None, description="The article headline")
+    summary: Optional[str] = Field(None, description="The AI generated summary")
+    image_url: Optional[str] = Field(None, description="The article image")
+    url: Optional[str] = Field(None, description="The original article URL")
+    published_at: Optional[datetime] = Field(None, description="When the article was published")
+    sentiment: Optional[str] = Field(None, description="positive, negative or neutral")
+    source: Optional[str] = Field(None, description="The publisher of the article")
+    category: Optional[str] = Field(None, description="The interest category of the article")
+
+    class Config:
+        from_attributes = True
+
+class NewsListResponse(BaseModel):
+    data: List[NewsSchema]
+    count: int
+    next_cursor: Optional[str] = None
+    success: bool
+
+class InterestListResponse(BaseModel):
+    data: List[InterestSchema]
+    success: bool
+
+class UserResponse(BaseModel):
+    data: UserSchema
+    success: bool
+
+def schema_columns(model: Any, schema: Type[BaseModel]) -> List[Any]:
+    """Model columns matching the schema fields, for queries that skip building ORM objects"""
+    return [getattr(model, name) for name in schema.model_fields]
+
+def parse_fields(schema: Type[BaseModel], fields: Optional[str], always: Tuple[str, ...] = ("id",)) -> Tuple[str, ...]:
+    """Field names from a comma-separated fields= value, in schema order; every field when empty"""
+    if not fields:
+        return tuple(schema.model_fields)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(schema.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(name for name in schema.model_fields if name in requested or name in always)
+
+_projections: Dict[Tuple[Type[BaseModel], Tuple[str, ...]], Type[BaseModel]] = {}
+
+def project_schema(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    """The schema narrowed to the given fields, built once per combination"""
+    if names == tuple(schema.model_fields):
+        return schema
+    projected = _projections.get((schema, names))
+    if projected is None:
+        projected = _projections[(schema, names)] = create_model(
+            f"{schema.__name__}Projection",
+            __config__=ConfigDict(from_attributes=True),
+            **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names}
+        )
+    return projected
+
+def projection_columns(model: Any, names: Tuple[str, ...], *required: str) -> List[Any]:
+    """Model columns for the projected fields plus any the query itself needs (cursor keys)"""
+    return [getattr(model, name) for name in dict.fromkeys((*names, *required))]
+
+_adapters: Dict[Type[BaseModel], TypeAdapter] = {}
+
+def serialize_many(schema: Type[BaseModel], rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Validate ORM objects or result rows against a schema and dump them to plain dicts"""
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        adapter = _adapters[schema] = TypeAdapter(List[schema])
+    return adapter.dump_python(adapter.validate_python(list(rows), from_attributes=True))
+
+def serialize(schema: Type[BaseModel], row: Any) -> Dict[str, Any]:
+    return schema.model_validate(row, from_attributes=True).model_dump()
@@ -0,0 +1,33 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Set
+
+class Broadcaster:
+    """Fans published items out to every current subscriber's bounded queue"""
+
+    def __init__(self, max_queue_size: int = 1000):
+        self.max_queue_size = max_queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(self.max_queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def publish(self, items: List[Any]) -> None:
+        for queue in list(self._subscribers):
+            for item in items:
+                # A slow subscriber loses its oldest items rather than holding up ingestion
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(item)
+
+news_broadcaster = Broadcaster()
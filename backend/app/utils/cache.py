@@ -1,22 +1,189 @@
-from datetime import datetime, timedelta
-from typing import Dict, Any, Tuple
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+def approximate_size(value: Any) -> int:
+    """Rough byte size of a cached value, following containers and public object attributes"""
+    seen = set()
+    stack = [value]
+    size = 0
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not isinstance(item, type):
+            stack.extend(v for k, v in vars(item).items() if not k.startswith("_"))
+
+    return size
 
 class TTLCache:
-    def __init__(self):
-        self._cache: Dict[str, Tuple[Any, datetime]] = {}
+    """
+    Bounded LRU cache with monotonic-clock expiry
+
+    Entries are evicted least recently used first once either max_entries or
+    max_bytes is exceeded. Expired entries stay servable for stale_seconds
+    through get_or_load, which returns them immediately and refreshes them
+    with a single background load.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 300,
+        stale_seconds: float = 300,
+        sweep_interval: float = 60,
+        sizeof: Callable[[Any], int] = approximate_size
+    ):
+        # key -> (value, expires_at, size)
+        self._cache: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.sweep_interval = sweep_interval
+        self.sizeof = sizeof
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._cache.pop(key)
+        self._bytes -= size
+
+    def _lookup(self, key: str) -> Tuple[Any, bool]:
+        """Return (value, fresh) for a servable entry, or (None, False)"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None, False
+
+        value, expires_at, _ = entry
+        now = time.monotonic()
+        if now >= expires_at + self.stale_seconds:
+            self._remove(key)
+            return None, False
+
+        self._cache.move_to_end(key)
+        return value, now < expires_at
 
     def get(self, key: str) -> Any:
+        value, fresh = self._lookup(key)
+        if fresh:
+            self.hits += 1
+            return value
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._cache:
+            self._remove(key)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._cache[key] = (value, time.monotonic() + ttl, size)
+        self._bytes += size
+
+        while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._cache)))
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
         if key in self._cache:
-            data, expiry = self._cache[key]
-            if datetime.now() < expiry:
-                return data
+            self._remove(key)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None
+    ) -> Any:
+        """Serve from the cache, serving stale entries while one background load refreshes them"""
+        value, fresh = self._lookup(key)
+        if value is not None:
+            if fresh:
+                self.hits += 1
             else:
-                del self._cache[key]
-        return None
+                self.stale_hits += 1
+                if key not in self._refreshing:
+                    self._refreshing[key] = asyncio.create_task(self._refresh(key, loader, ttl_seconds))
+            return value
+
+        self.misses += 1
+        value = await loader()
+        self.set(key, value, ttl_seconds)
+        return value
+
+    async def _refresh(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: Optional[float]) -> None:
+        try:
+            self.set(key, await loader(), ttl_seconds)
+        except Exception as e:
+            print(f"Cache refresh failed for {key}: {str(e)}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    def sweep(self) -> int:
+        """Remove entries that are past their stale window"""
+        now = time.monotonic()
+        expired = [
+            key for key, (_, expires_at, _) in self._cache.items()
+            if now >= expires_at + self.stale_seconds
+        ]
+        for key in expired:
+            self._remove(key)
+        self.evictions += len(expired)
+        return len(expired)
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+
+    def start_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def stop_sweeper(self) -> None:
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        try:
+            await self._sweeper
+        except asyncio.CancelledError:
+            pass
+        self._sweeper = None
 
-    def set(self, key: str, value: Any, ttl_seconds: int = 300): # 5 minutes
-        expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-        self._cache[key] = (value, expiry)
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0
+        }
 
     def clear(self):
-        self._cache.clear()
\ No newline at end of file
+        self._cache.clear()
+        self._bytes = 0
@@ -0,0 +1,102 @@
+from typing import Dict, Optional
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # installed from requirements.txt; without it only gzip is offered
+    brotli = None
+
+# Bodies at least this large are compressed in a worker thread instead of on the event loop
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding as {coding: q}, e.g. "br;q=1.0, gzip;q=0.5" -> {"br": 1.0, "gzip": 0.5}"""
+    encodings = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        encodings[coding.strip().lower()] = q
+    return encodings
+
+class _WeakETagMixin:
+    """Compressed bodies are a different representation, so a strong ETag becomes weak (as nginx does)"""
+
+    content_encoding: str
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_with_weak_etag(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/") and headers.get("content-encoding") == self.content_encoding:
+                    headers["ETag"] = f"W/{etag}"
+            await send(message)
+
+        await super().__call__(scope, receive, send_with_weak_etag)
+
+class GzipEncodingResponder(_WeakETagMixin, GZipResponder):
+    pass
+
+class BrotliResponder(_WeakETagMixin, IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int):
+        super().__init__(app, minimum_size)
+        self.quality = quality
+        self._compressor: Optional["brotli.Compressor"] = None
+
+    def _compress_body(self, body: bytes, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(quality=self.quality)
+        # Streaming bodies are flushed per chunk so each NDJSON line still reaches the client as it is sent
+        compressed = self._compressor.process(body)
+        return compressed + (self._compressor.flush() if more_body else self._compressor.finish())
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self._compress_body, body, more_body)
+        return self._compress_body(body, more_body)
+
+class CompressionMiddleware:
+    """Negotiated brotli or gzip for responses of at least minimum_size bytes"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _responder(self, accept_encoding: str) -> ASGIApp:
+        encodings = accepted_encodings(accept_encoding)
+        wildcard = encodings.get("*", 0.0)
+        br = encodings.get("br", wildcard) if brotli is not None else 0.0
+        gzip = encodings.get("gzip", wildcard)
+
+        # Brotli wins ties: it is smaller at a comparable cost for JSON
+        if br > 0 and br >= gzip:
+            return BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        if gzip > 0:
+            return GzipEncodingResponder(
+                self.app, self.minimum_size, compresslevel=self.gzip_level, thread_minimum_size=THREAD_MINIMUM_SIZE
+            )
+        # Still adds Vary: Accept-Encoding so shared caches keep the encodings apart
+        return IdentityResponder(self.app, self.minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        responder = self._responder(Headers(scope=scope).get("accept-encoding", ""))
+        await responder(scope, receive, send)
@@ -0,0 +1,64 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+async def gather_bounded(
+    items: Iterable[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    limit: int
+) -> List[Any]:
+    """
+    Run worker over items concurrently with at most `limit` in flight
+
+    Results keep the input order. A failing item yields its exception
+    in place of a result instead of cancelling the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item: Any) -> Any:
+        async with semaphore:
+            return await worker(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+class SingleFlight:
+    """Lets concurrent callers with the same key share one in-flight call instead of repeating it"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def claim(self, key: Hashable) -> Optional[asyncio.Future]:
+        """Return the future of the call already in flight for key, or None after making the caller its owner"""
+        future = self._calls.get(key)
+        if future is not None:
+            return future
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting on it, so a failure should not be reported as never retrieved
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return None
+
+    def resolve(self, key: Hashable, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Finish the owned call for key, handing its result or error to every waiter"""
+        future = self._calls.pop(key, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        future = self.claim(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            self.resolve(key, error=RuntimeError("Shared call was cancelled"))
+            raise
+        except Exception as e:
+            self.resolve(key, error=e)
+            raise
+        self.resolve(key, result)
+        return result
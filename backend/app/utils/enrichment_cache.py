@@ -0,0 +1,116 @@
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Set
+from sqlalchemy import select, delete, update, func
+from app.database import open_session, write_queue
+from app.models.enrichment_cache import EnrichmentCacheEntry
+
+class EnrichmentCache:
+    """Persistent cache of LLM enrichment results keyed by a hash of the article content"""
+
+    def __init__(self, ttl_seconds: int = 30 * 24 * 3600, max_entries: int = 50000, evict_every: int = 100, touch_every: int = 100):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self.touch_every = touch_every
+        # Keys read since the last flush; their last_accessed_at is written in one batch
+        self._touched: Set[str] = set()
+        self._flushing: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+    @staticmethod
+    def _normalize(value: Any) -> str:
+        return " ".join(str(value or "").lower().split())
+
+    def make_key(self, kind: str, prompt_version: str, model_name: str, title: str, description: str, *extra: Any) -> str:
+        """Hash the normalized article text together with everything that changes the LLM output"""
+        parts = [kind, prompt_version, model_name, self._normalize(title), self._normalize(description)]
+        parts.extend(self._normalize(value) for value in extra)
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        async with open_session() as db:
+            entry = await db.get(EnrichmentCacheEntry, key)
+            now = datetime.now()
+            if entry is None or entry.created_at < now - self.ttl:
+                self.misses += 1
+                return None
+
+            value = entry.value
+
+        # A hit never waits on the write queue, and a failed touch cannot fail the lookup
+        self._touched.add(key)
+        if len(self._touched) >= self.touch_every and (self._flushing is None or self._flushing.done()):
+            self._flushing = asyncio.create_task(self.flush_touches())
+        self.hits += 1
+        return value
+
+    async def flush_touches(self) -> None:
+        """Record the last access of every key read since the previous flush, in one write"""
+        keys, self._touched = self._touched, set()
+        if not keys:
+            return
+
+        async def touch(db):
+            await db.execute(update(EnrichmentCacheEntry).where(
+                EnrichmentCacheEntry.key.in_(keys)
+            ).values(last_accessed_at=datetime.now()))
+
+        try:
+            await write_queue.submit(touch)
+        except Exception as e:
+            print(f"Enrichment cache touch error: {str(e)}")
+
+    async def set(self, key: str, kind: str, value: str) -> None:
+        async def save(db):
+            now = datetime.now()
+            await db.merge(EnrichmentCacheEntry(
+                key=key,
+                kind=kind,
+                value=value,
+                created_at=now,
+                last_accessed_at=now
+            ))
+
+        try:
+            await write_queue.submit(save)
+        except Exception as e:
+            print(f"Enrichment cache write error: {str(e)}")
+
+        self._writes += 1
+        if self._writes % self.evict_every == 0:
+            await self.evict()
+
+    async def evict(self) -> int:
+        """Drop expired entries, then the least recently used ones above max_entries"""
+        await self.flush_touches()
+
+        async def remove(db):
+            result = await db.execute(delete(EnrichmentCacheEntry).where(
+                EnrichmentCacheEntry.created_at < datetime.now() - self.ttl
+            ))
+            removed = result.rowcount
+
+            overflow = await db.scalar(select(func.count()).select_from(EnrichmentCacheEntry)) - self.max_entries
+            if overflow > 0:
+                oldest = select(EnrichmentCacheEntry.key).order_by(
+                    EnrichmentCacheEntry.last_accessed_at
+                ).limit(overflow)
+                result = await db.execute(delete(EnrichmentCacheEntry).where(
+                    EnrichmentCacheEntry.key.in_(oldest.scalar_subquery())
+                ))
+                removed += result.rowcount
+            return removed
+
+        return await write_queue.submit(remove)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,68 @@
+import time
+from typing import Dict, Iterable, Optional
+from decouple import config
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from app.database import open_session
+from app.models.content_version import ContentVersion
+
+NEWS_VERSION = "news"
+# Bumped when an ingestion cycle completes, for workers that did not run it
+INGESTION_VERSION = "ingestion"
+
+def bookmarks_version_key(user_id: int) -> str:
+    return f"bookmarks:{user_id}"
+
+def bump_versions(*keys: str):
+    """INSERT ... ON CONFLICT that increments each version; run it in the transaction making the change"""
+    statement = insert(ContentVersion).values([{"key": key, "version": 1} for key in keys])
+    return statement.on_conflict_do_update(
+        index_elements=["key"],
+        set_={"version": ContentVersion.version + 1}
+    )
+
+async def read_versions(db, keys: Iterable[str]) -> Dict[str, int]:
+    """Current version of each key, 0 for keys never changed; a primary key lookup per key"""
+    keys = list(keys)
+    result = await db.execute(select(ContentVersion.key, ContentVersion.version).where(ContentVersion.key.in_(keys)))
+    versions = dict(result.all())
+    return {key: versions.get(key, 0) for key in keys}
+
+class CachedVersion:
+    """A version held in process for ttl_seconds, so hot polls do not each need a database round trip"""
+
+    def __init__(self, key: str, ttl_seconds: float):
+        self.key = key
+        self.ttl_seconds = ttl_seconds
+        self._version: Optional[int] = None
+        self._loaded_at = 0.0
+
+    async def get(self) -> int:
+        if self._version is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+            return self._version
+        async with open_session() as db:
+            version = (await read_versions(db, [self.key]))[self.key]
+        self._version, self._loaded_at = version, time.monotonic()
+        return version
+
+    def invalidate(self) -> None:
+        self._version = None
+
+# Saves in this process invalidate it at once; other workers pick a change up within the TTL
+news_version = CachedVersion(NEWS_VERSION, config("news_version_ttl_seconds", default=1.0, cast=float))
+
+def make_etag(*parts: object) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for it) against a list of tags or *"""
+    header: Optional[str] = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
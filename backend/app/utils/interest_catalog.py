@@ -0,0 +1,52 @@
+import asyncio
+import hashlib
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+import orjson
+from sqlalchemy import event, select
+from app.database import open_session
+from app.models.interest import Interest
+
+class InterestCatalog:
+    """Immutable snapshot of the interest catalog with its pre-rendered /interests body"""
+
+    def __init__(self, interests: Tuple[Tuple[int, str], ...]):
+        self.interests = interests
+        self.by_id: Mapping[int, str] = MappingProxyType(dict(interests))
+        self.body = orjson.dumps({
+            "data": [{"id": interest_id, "name": name} for interest_id, name in interests],
+            "success": True
+        })
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()}"'
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(name for _, name in self.interests)
+
+class InterestCatalogStore:
+    """Loads the catalog once per process and reloads it after the interests table changes"""
+
+    def __init__(self):
+        self._catalog: Optional[InterestCatalog] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> InterestCatalog:
+        catalog = self._catalog
+        if catalog is not None:
+            return catalog
+
+        async with self._lock:
+            if self._catalog is None:
+                async with open_session() as db:
+                    result = await db.execute(select(Interest.id, Interest.name).order_by(Interest.id))
+                    self._catalog = InterestCatalog(tuple((row.id, row.name) for row in result))
+            return self._catalog
+
+    def invalidate(self, *args) -> None:
+        self._catalog = None
+
+interest_catalog = InterestCatalogStore()
+
+# Any ORM write to Interest in this process drops the snapshot
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(Interest, _event, interest_catalog.invalidate)
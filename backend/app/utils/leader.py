@@ -0,0 +1,81 @@
+import asyncio
+import os
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+class LeaderElection:
+    """
+    Picks one leader among the worker processes on a host with an exclusive lock on a file
+
+    Whichever process holds the lock is the leader; the others retry every
+    retry_seconds, so a follower takes over within that long if the leader exits.
+    The operating system drops the lock when its holder dies, even on a crash.
+    The lock file holds the leader's pid.
+    """
+
+    def __init__(self, path: str, retry_seconds: float = 10, on_elected: Optional[Callable[[], None]] = None):
+        self.path = path
+        self.retry_seconds = retry_seconds
+        self.on_elected = on_elected
+        self._fd: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """Take the lock without blocking; True if this process is (now) the leader"""
+        if self._fd is not None:
+            return True
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+
+        if fcntl is not None:
+            os.ftruncate(fd, 0)
+            os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        print(f"Worker {os.getpid()} is the leader")
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        if fcntl is None:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        os.close(self._fd)
+        self._fd = None
+
+    async def _campaign(self) -> None:
+        while not self.try_acquire():
+            await asyncio.sleep(self.retry_seconds)
+        if self.on_elected:
+            self.on_elected()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._campaign())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.release()
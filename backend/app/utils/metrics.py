@@ -0,0 +1,193 @@
+import bisect
+import threading
+import time
+import weakref
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from decouple import config
+from sqlalchemy import event
+
+METRICS_ENABLED = config("metrics_enabled", default=True, cast=bool)
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_value(value: float) -> str:
+    """Shortest exact form; :g would round counters past 6 digits (1234568 -> 1.23457e+06)"""
+    return repr(float(value))
+
+def _format_labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Counter:
+    """Monotonic count per label combination"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+class Histogram:
+    """Cumulative bucket counts, sum and count per label combination"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            # One slot per bucket plus +Inf, then the running sum
+            slots = self._values.get(labels)
+            if slots is None:
+                slots = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+            slots[index] += 1
+            slots[-1] += value
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = [(labels, list(slots)) for labels, slots in self._values.items()]
+        for labels, slots in values:
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), slots[:-1]):
+                cumulative += count
+                le = bound if bound == "+Inf" else f"{bound:g}"
+                yield f"{self.name}_bucket{_format_labels((*self.label_names, 'le'), (*labels, le))} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(slots[-1])}"
+            yield f"{self.name}_count{_format_labels(self.label_names, labels)} {_format_value(cumulative)}"
+
+class Registry:
+    """Metrics rendered in the Prometheus text exposition format"""
+
+    def __init__(self):
+        self._metrics: List[Any] = []
+        self._caches: Dict[str, Any] = {}
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_cache(self, name: str, cache: Any) -> None:
+        """Report cache.stats() under name at scrape time; the cache is only weakly referenced"""
+        self._caches[name] = weakref.ref(cache)
+
+    def _cache_samples(self) -> Iterable[str]:
+        stats = {name: ref() for name, ref in self._caches.items()}
+        stats = {name: cache.stats() for name, cache in stats.items() if cache is not None}
+        for metric, key, kind, help in (
+            ("cache_hits_total", "hits", "counter", "Cache lookups served fresh"),
+            ("cache_stale_hits_total", "stale_hits", "counter", "Cache lookups served stale while refreshing"),
+            ("cache_misses_total", "misses", "counter", "Cache lookups that had to load"),
+            ("cache_evictions_total", "evictions", "counter", "Entries evicted to stay within bounds"),
+            ("cache_entries", "entries", "gauge", "Entries currently cached"),
+            ("cache_bytes", "bytes", "gauge", "Approximate size of the cached values"),
+            ("cache_hit_ratio", "hit_ratio", "gauge", "Share of lookups served from the cache"),
+        ):
+            present = [(name, values[key]) for name, values in stats.items() if key in values]
+            if not present:
+                continue
+            yield f"# HELP {metric} {help}"
+            yield f"# TYPE {metric} {kind}"
+            for name, value in present:
+                yield f'{metric}{{cache="{name}"}} {_format_value(value)}'
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        lines.extend(self._cache_samples())
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+NODE_DURATION = registry.histogram("pipeline_node_duration_seconds", "Time spent in each processing graph node", ["node"])
+NODE_ERRORS = registry.counter("pipeline_node_errors_total", "Graph node runs that raised or returned a failed status", ["node"])
+PROVIDER_DURATION = registry.histogram("provider_request_duration_seconds", "News provider HTTP request latency", ["provider"])
+PROVIDER_RESPONSES = registry.counter("provider_responses_total", "News provider responses by status code, or error for transport failures", ["provider", "status"])
+LLM_DURATION = registry.histogram("llm_request_duration_seconds", "LLM call latency", ["agent"])
+LLM_ERRORS = registry.counter("llm_errors_total", "LLM calls that raised", ["agent"])
+LLM_TOKENS = registry.counter("llm_tokens_total", "Tokens reported by the LLM", ["agent", "type"])
+DB_QUERY_DURATION = registry.histogram("db_query_duration_seconds", "Database statement execution time", ["operation"])
+
+def timed_node(name: str, node: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]):
+    """Wrap a graph node so its duration and failures are recorded"""
+    @wraps(node)
+    async def run(state: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = await node(state)
+        except Exception:
+            NODE_ERRORS.inc(name)
+            raise
+        finally:
+            NODE_DURATION.observe(time.perf_counter() - started, name)
+        # Counted once, by the node that failed, not again by every node the failed state passes through
+        if isinstance(result, dict) and result.get("status") == "failed" and state.get("status") != "failed":
+            NODE_ERRORS.inc(name)
+        return result
+    return run
+
+async def invoke_llm(llm: Any, messages: Any, agent: str) -> Any:
+    """llm.ainvoke(messages) with latency, error and token usage recorded"""
+    started = time.perf_counter()
+    try:
+        response = await llm.ainvoke(messages)
+    except Exception:
+        LLM_ERRORS.inc(agent)
+        raise
+    finally:
+        LLM_DURATION.observe(time.perf_counter() - started, agent)
+
+    usage: Optional[Dict[str, Any]] = getattr(response, "usage_metadata", None)
+    if usage:
+        LLM_TOKENS.inc(agent, "input", amount=usage.get("input_tokens", 0))
+        LLM_TOKENS.inc(agent, "output", amount=usage.get("output_tokens", 0))
+    return response
+
+def _before_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    context._metrics_started = time.perf_counter()
+
+def _after_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    started = getattr(context, "_metrics_started", None)
+    if started is None:
+        return
+    words = statement[:32].split(None, 1)
+    DB_QUERY_DURATION.observe(time.perf_counter() - started, words[0].upper() if words else "OTHER")
+
+def instrument_engine(sync_engine: Any) -> None:
+    """Time every statement run on a sync engine, or on an async engine's sync_engine"""
+    if event.contains(sync_engine, "before_cursor_execute", _before_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_execute)
@@ -0,0 +1,75 @@
+import hashlib
+import random
+import re
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240101)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# Syndicated headlines often differ only by a trailing " - Source" or " | Source"
+_SOURCE_SUFFIX = re.compile(r"\s[-|]\s[^-|]{1,40}$")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+def shingles(title: Optional[str], description: Optional[str] = None) -> FrozenSet[str]:
+    """Normalized word set of the title and description"""
+    title = _SOURCE_SUFFIX.sub("", (title or "").lower())
+    tokens = _TOKEN.findall(title) + _TOKEN.findall((description or "").lower())
+    return frozenset(token for token in tokens if token not in _STOPWORDS)
+
+def signature(features: FrozenSet[str]) -> Tuple[int, ...]:
+    """MinHash signature; the share of equal positions estimates the Jaccard similarity"""
+    if not features:
+        return ()
+    hashes = [int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big") for feature in features]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+def band_keys(sig: Sequence[int]) -> List[str]:
+    """LSH bucket per band; signatures sharing any bucket are candidate duplicates"""
+    if not sig:
+        return []
+    return [
+        f"{band}:" + hashlib.blake2b(repr(sig[band * ROWS:(band + 1) * ROWS]).encode(), digest_size=8).hexdigest()
+        for band in range(BANDS)
+    ]
+
+def encode_signature(sig: Sequence[int]) -> str:
+    return ",".join(map(str, sig))
+
+def decode_signature(value: str) -> Tuple[int, ...]:
+    return tuple(int(part) for part in value.split(",")) if value else ()
+
+class MinHashIndex:
+    """In-memory LSH index of signatures keyed by article URL"""
+
+    def __init__(self, threshold: float = 0.6):
+        self.threshold = threshold
+        self._buckets: Dict[str, List[str]] = {}
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+
+    def find(self, sig: Sequence[int]) -> Optional[str]:
+        """Most similar indexed key at or above the threshold, if any"""
+        best = None
+        for bucket in band_keys(sig):
+            for key in self._buckets.get(bucket, ()):
+                score = similarity(sig, self._signatures[key])
+                if score >= self.threshold and (best is None or score > best[0]):
+                    best = (score, key)
+        return best[1] if best else None
+
+    def add(self, key: str, sig: Sequence[int]) -> None:
+        self._signatures[key] = tuple(sig)
+        for bucket in band_keys(sig):
+            self._buckets.setdefault(bucket, []).append(key)
@@ -0,0 +1,29 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+def encode_cursor(published_at: datetime, item_id: int) -> str:
+    """Encode the (published_at, id) position of the last returned row as an opaque cursor"""
+    raw = f"{published_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if it is malformed"""
+    try:
+        published_at, item_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(published_at), int(item_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def encode_search_cursor(rank: float, item_id: int, min_id: Optional[int]) -> str:
+    """Encode the (rank, id) of the last search result and the candidate floor of the first page"""
+    raw = f"{rank!r}|{item_id}|{min_id or ''}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int, Optional[int]]:
+    """Decode a cursor produced by encode_search_cursor, raising ValueError if it is malformed"""
+    try:
+        rank, item_id, min_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return float(rank), int(item_id), int(min_id) if min_id else None
+    except Exception:
+        raise ValueError("Invalid cursor")
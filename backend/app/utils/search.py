@@ -0,0 +1,88 @@
+import re
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+from sqlalchemy import select, insert, func, literal, literal_column, inspect, text, tuple_
+from sqlalchemy.sql import table, column
+from app.models.news import News
+
+# External-content FTS5 index over news: the text lives in the news table only
+CREATE_NEWS_FTS = (
+    "CREATE VIRTUAL TABLE news_fts USING fts5("
+    "title, summary, source, content='news', content_rowid='id', tokenize='porter unicode61')"
+)
+
+news_fts = table("news_fts", column("news_fts"), column("rowid"), column("title"), column("summary"), column("source"))
+_fts = literal_column("news_fts")
+# Title matches count more than summary matches, source matches the least
+rank = func.bm25(_fts, 10.0, 4.0, 1.0)
+
+_TERM = re.compile(r"\w+\*?", re.UNICODE)
+
+def ensure_search_index(engine: Any) -> None:
+    """Create news_fts if missing and index any articles saved before it existed"""
+    if inspect(engine).has_table("news_fts"):
+        return
+    with engine.begin() as connection:
+        connection.execute(text(CREATE_NEWS_FTS))
+        connection.execute(text("INSERT INTO news_fts(news_fts) VALUES('rebuild')"))
+
+def match_expression(query: str) -> Optional[str]:
+    """Turn free text into an FTS5 query that ANDs every word; a trailing * keeps prefix search"""
+    terms = []
+    for term in _TERM.findall(query):
+        prefix = term.endswith("*")
+        word = term.rstrip("*")
+        if word:
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return " ".join(terms) or None
+
+def unindex_urls(urls: Sequence[str]):
+    """Remove the current index entries of these articles; run before their rows change"""
+    return insert(news_fts).from_select(
+        ["news_fts", "rowid", "title", "summary", "source"],
+        select(literal("delete"), News.id, News.title, News.summary, News.source).where(News.url.in_(urls))
+    )
+
+def index_urls(urls: Sequence[str]):
+    """Index the saved rows of these articles"""
+    return insert(news_fts).from_select(
+        ["rowid", "title", "summary", "source"],
+        select(News.id, News.title, News.summary, News.source).where(News.url.in_(urls))
+    )
+
+def candidate_floor(match: str, max_candidates: int):
+    """Smallest id among the newest max_candidates matches, so very common terms rank a bounded set"""
+    return select(news_fts.c.rowid).where(_fts.match(match)).order_by(
+        news_fts.c.rowid.desc()
+    ).limit(1).offset(max_candidates - 1)
+
+def search_query(
+    columns: List[Any],
+    match: str,
+    limit: int,
+    category: Optional[str] = None,
+    sentiment: Optional[str] = None,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = None,
+    after: Optional[tuple] = None,
+    min_id: Optional[int] = None
+):
+    """BM25-ranked search, best first, continuing strictly after the (rank, id) in after"""
+    query = select(*columns, rank.label("rank")).select_from(
+        news_fts.join(News, News.id == news_fts.c.rowid)
+    ).where(_fts.match(match), News.processing_status == "completed")
+
+    if min_id:
+        query = query.where(news_fts.c.rowid >= min_id)
+    if category:
+        query = query.where(News.category == category)
+    if sentiment:
+        query = query.where(News.sentiment == sentiment)
+    if published_from:
+        query = query.where(News.published_at >= published_from)
+    if published_to:
+        query = query.where(News.published_at < published_to)
+    if after:
+        query = query.where(tuple_(rank, News.id) > tuple_(*after))
+
+    return query.order_by(rank, News.id).limit(limit)
@@ -0,0 +1,226 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import orjson
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    refreshing_until REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_cache_expires_at ON cache (expires_at);
+"""
+
+# A worker refreshing a stale entry holds it this long before another worker may try
+REFRESH_LEASE_SECONDS = 30.0
+
+class SQLiteCache:
+    """
+    TTL cache shared by every worker process on the host, stored in one SQLite file
+
+    Same interface as TTLCache. Values must be JSON-serializable (they are stored
+    with orjson). Expiry uses the wall clock, since monotonic clocks are not
+    comparable between processes. Once max_entries or max_bytes is exceeded the
+    entries closest to expiring are evicted first; the bounds are checked every
+    evict_every writes and on each sweep, so they may be overshot by that many writes.
+    A stale entry is refreshed by a single worker: the first one to claim it for
+    REFRESH_LEASE_SECONDS. get_or_load and the sweeper run their queries in a thread
+    so a locked database never stalls the event loop.
+    Hit and miss counts are per process; entries and bytes are for the whole file,
+    as of the last bounds check.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 300,
+        stale_seconds: float = 300,
+        sweep_interval: float = 60,
+        busy_timeout_ms: int = 250,
+        evict_every: int = 32
+    ):
+        # The cache is disposable, so writes skip fsync; WAL lets readers run alongside a writer
+        self._db = sqlite3.connect(path, timeout=busy_timeout_ms / 1000, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.sweep_interval = sweep_interval
+        self.evict_every = evict_every
+        self._writes = 0
+        self._last_totals = self._totals()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _execute(self, sql: str, params: Any = (), many: bool = False) -> Tuple[List[tuple], int]:
+        """(rows, rowcount) of one statement; a locked or failing cache acts as an empty one instead of failing the request"""
+        try:
+            with self._lock:
+                cursor = self._db.executemany(sql, params) if many else self._db.execute(sql, params)
+                return cursor.fetchall(), cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Shared cache error: {str(e)}")
+            return [], 0
+
+    def _totals(self) -> Tuple[int, int]:
+        rows, _ = self._execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache")
+        return rows[0] if rows else (0, 0)
+
+    def __len__(self) -> int:
+        return self._totals()[0]
+
+    def _lookup(self, key: str) -> Tuple[Any, bool]:
+        """Return (value, fresh) for a servable entry, or (None, False)"""
+        rows, _ = self._execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,))
+        if not rows:
+            return None, False
+
+        value, expires_at = rows[0]
+        now = time.time()
+        if now >= expires_at + self.stale_seconds:
+            return None, False
+        return orjson.loads(value), now < expires_at
+
+    def get(self, key: str) -> Any:
+        value, fresh = self._lookup(key)
+        if fresh:
+            self.hits += 1
+            return value
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        body = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        if len(body) > self.max_bytes:
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at, size) VALUES (?, ?, ?, ?)",
+            (key, body, time.time() + ttl, len(body))
+        )
+        # Counting the whole table on every write would cost more than the write itself
+        self._writes += 1
+        if self._writes % self.evict_every == 0:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries, size = self._last_totals = self._totals()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+
+        # Drop from the soonest expiry until both bounds hold again
+        rows, _ = self._execute("SELECT key, size FROM cache ORDER BY expires_at")
+        doomed = []
+        for key, entry_size in rows:
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            doomed.append((key,))
+            entries -= 1
+            size -= entry_size
+        _, removed = self._execute("DELETE FROM cache WHERE key = ?", doomed, many=True)
+        self.evictions += max(removed, 0)
+        self._last_totals = (entries, size)
+
+    def delete(self, key: str) -> None:
+        self._execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def _claim_refresh(self, key: str) -> bool:
+        """Whether this worker won the right to refresh a stale entry"""
+        now = time.time()
+        _, claimed = self._execute(
+            "UPDATE cache SET refreshing_until = ? WHERE key = ? AND refreshing_until < ?",
+            (now + REFRESH_LEASE_SECONDS, key, now)
+        )
+        return claimed == 1
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None
+    ) -> Any:
+        """Serve from the cache, serving stale entries while one background load (in any worker) refreshes them"""
+        value, fresh = await asyncio.to_thread(self._lookup, key)
+        if value is not None:
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                if key not in self._refreshing and await asyncio.to_thread(self._claim_refresh, key):
+                    self._refreshing[key] = asyncio.create_task(self._refresh(key, loader, ttl_seconds))
+            return value
+
+        self.misses += 1
+        value = await loader()
+        await asyncio.to_thread(self.set, key, value, ttl_seconds)
+        return value
+
+    async def _refresh(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: Optional[float]) -> None:
+        try:
+            await asyncio.to_thread(self.set, key, await loader(), ttl_seconds)
+        except Exception as e:
+            print(f"Cache refresh failed for {key}: {str(e)}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    def sweep(self) -> int:
+        """Remove entries that are past their stale window, then enforce the bounds"""
+        _, removed = self._execute("DELETE FROM cache WHERE expires_at < ?", (time.time() - self.stale_seconds,))
+        self.evictions += max(removed, 0)
+        self._evict()
+        return max(removed, 0)
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await asyncio.to_thread(self.sweep)
+
+    def start_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def stop_sweeper(self) -> None:
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        try:
+            await self._sweeper
+        except asyncio.CancelledError:
+            pass
+        self._sweeper = None
+
+    def stats(self) -> Dict[str, Any]:
+        # Scraped on the event loop, so the totals come from the last bounds check rather than a query
+        entries, size = self._last_totals
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        """Empty the cache for every worker"""
+        self._execute("DELETE FROM cache")
+        self._last_totals = (0, 0)
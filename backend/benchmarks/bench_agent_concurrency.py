@@ -0,0 +1,38 @@
+"""
+Compare sequential and bounded-concurrency article processing
+
+    cd backend && python -m benchmarks.bench_agent_concurrency
+"""
+import asyncio
+import time
+from app.langgraph.agents.analyzer import SentimentAnalyzerAgent
+from app.langgraph.agents.summarizer import SummarizerAgent
+from benchmarks.fake_llm import FakeChatModel, make_articles
+
+ARTICLES = 20
+
+async def run(max_concurrency: int) -> None:
+    config = {"openai_api_key": "fake", "max_concurrency": max_concurrency}
+    analyzer = SentimentAnalyzerAgent(config)
+    summarizer = SummarizerAgent(config)
+    analyzer.llm = FakeChatModel(seed=1)
+    summarizer.llm = FakeChatModel(seed=2)
+
+    state = {"category": "technology", "articles": make_articles(ARTICLES)}
+    started = time.perf_counter()
+    state = await analyzer.process(state)
+    state = await summarizer.process(state)
+    elapsed = time.perf_counter() - started
+
+    sum_latency = analyzer.llm.total_latency + summarizer.llm.total_latency
+    print(
+        f"max_concurrency={max_concurrency:>3}  wall={elapsed:6.2f}s  "
+        f"sum_of_latencies={sum_latency:6.2f}s  articles={len(state['articles'])}"
+    )
+
+async def main() -> None:
+    for max_concurrency in (1, 5, 20):
+        await run(max_concurrency)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,196 @@
+"""
+Precision/recall of near-duplicate detection and the LLM calls it saves
+
+    cd backend && python -m benchmarks.bench_dedupe
+
+Builds a labelled stream of stories with syndicated copies (source suffixes,
+edited headlines, truncated or reworded descriptions) and follow-up stories
+that share much of their wording but are different articles. The stream is
+matched the way DeduplicatorAgent does it: each article is looked up in the
+LSH index and either linked to a canonical article or added as a new one.
+Fails when precision or recall drops below the bounds in MIN_QUALITY.
+
+It then runs DeduplicatorAgent and DatabaseAgent against a temporary database
+and checks that copies are linked within a batch, that copies arriving in a
+later run are matched through the stored article_signatures/article_bands and
+reuse the stored enrichment, and that a failed canonical's enrichment is not.
+"""
+import asyncio
+import os
+import random
+import tempfile
+import time
+from app.utils.minhash import MinHashIndex, shingles, signature
+
+STORIES = 3000
+COPY_RATE = 0.4
+FOLLOW_UP_RATE = 0.1
+VOCABULARY = 5000
+SOURCES = ["Reuters", "AP", "BBC News", "The Verge", "CNN", "Bloomberg"]
+# threshold -> (precision, recall) the generated stream must reach; the stream is seeded, so these are stable
+MIN_QUALITY = {0.5: (0.93, 0.97), 0.6: (0.97, 0.95), 0.7: (0.99, 0.85), 0.8: (0.99, 0.55)}
+
+def make_stream(seed: int = 11) -> list:
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(VOCABULARY)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY)]
+
+    def words(count: int) -> list:
+        return rng.choices(vocabulary, weights=weights, k=count)
+
+    def edit(tokens: list, changes: int) -> list:
+        tokens = list(tokens)
+        for _ in range(changes):
+            tokens[rng.randrange(len(tokens))] = words(1)[0]
+        return tokens
+
+    stream = []
+    for story in range(STORIES):
+        title, description = words(rng.randint(6, 12)), words(rng.randint(15, 30))
+        stream.append((story, " ".join(title), " ".join(description)))
+
+        if rng.random() < COPY_RATE:
+            for _ in range(rng.randint(1, 3)):
+                copy_title = edit(title, rng.choice([0, 0, 1]))
+                copy_description = description[:max(8, int(len(description) * rng.uniform(0.7, 1.0)))]
+                stream.append((
+                    story,
+                    f"{' '.join(copy_title)} - {rng.choice(SOURCES)}",
+                    " ".join(edit(copy_description, rng.choice([0, 1, 2])))
+                ))
+
+        if rng.random() < FOLLOW_UP_RATE:
+            # A different article about the same topic, so not a duplicate
+            stream.append((
+                f"{story}-follow-up",
+                " ".join(edit(title, len(title) // 2)),
+                " ".join(edit(description, len(description) // 2))
+            ))
+
+    rng.shuffle(stream)
+    return stream
+
+def evaluate(stream: list, threshold: float) -> dict:
+    index = MinHashIndex(threshold)
+    canonical_story = {}
+    seen_stories = set()
+    true_duplicates = linked = correct = 0
+
+    started = time.perf_counter()
+    for key, (story, title, description) in enumerate(stream):
+        if story in seen_stories:
+            true_duplicates += 1
+        seen_stories.add(story)
+
+        sig = signature(shingles(title, description))
+        match = index.find(sig)
+        if match is None:
+            index.add(key, sig)
+            canonical_story[key] = story
+            continue
+
+        linked += 1
+        correct += canonical_story[match] == story
+    elapsed = time.perf_counter() - started
+
+    return {
+        "precision": correct / linked if linked else 1.0,
+        "recall": correct / true_duplicates if true_duplicates else 1.0,
+        "linked": linked,
+        "true_duplicates": true_duplicates,
+        "us_per_article": elapsed / len(stream) * 1e6,
+    }
+
+def configure(db: str) -> None:
+    # Settings are read when the app modules are imported, so they are set first
+    os.environ.update({
+        "database_url": f"sqlite:///{db}",
+        "async_database_url": f"sqlite+aiosqlite:///{db}",
+    })
+    for key in ("secret", "algorithm", "openai_api_key", "news_api_key", "media_stack_api_key"):
+        os.environ.setdefault(key, "benchmark")
+
+def article(url: str, title: str, description: str, **fields) -> dict:
+    return {"url": url, "title": title, "description": description, "published_at": "2024-01-01T00:00:00", "category": "world", **fields}
+
+async def check_agent() -> None:
+    from sqlalchemy import func, select
+    from app.database import Base, engine, open_session, write_queue
+    from app.langgraph.agents.database import DatabaseAgent
+    from app.langgraph.agents.deduplicator import DeduplicatorAgent
+    from app.models.article_signature import ArticleBand, ArticleSignature
+    from app.utils.search import ensure_search_index
+
+    Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
+    write_queue.start()
+    try:
+        dedupe, database = DeduplicatorAgent({"dedupe_threshold": 0.6}), DatabaseAgent()
+        storm = ("Storm closes harbor railway as council weighs flood barrier budget",
+                 "The harbor railway was shut overnight after the storm flooded two stations and the council met to weigh the flood barrier budget.")
+        museum = ("Glacier museum opens new wing dedicated to polar expeditions",
+                  "Visitors queued for hours to see the new wing, which holds sledges, diaries and photographs from three polar expeditions.")
+        airline = ("Airline pilots vote to strike over rostering dispute next month",
+                   "Pilots at the airline voted by a wide margin to strike next month after talks over rostering and rest periods broke down.")
+
+        # First run: the copy is linked to its canonical within the batch
+        state = await dedupe.process({"articles": [
+            article("https://a.example/storm", *storm),
+            article("https://b.example/storm", f"{storm[0]} - Reuters", storm[1]),
+            article("https://a.example/museum", *museum),
+            article("https://a.example/airline", *airline),
+        ]})
+        assert [a["url"] for a in state["articles"]] == ["https://a.example/storm", "https://a.example/museum", "https://a.example/airline"], state["articles"]
+        assert [(d["url"], d["canonical_url"]) for d in state["duplicates"]] == [("https://b.example/storm", "https://a.example/storm")], state["duplicates"]
+
+        # Enrich the canonicals, with the airline's LLM step failing, and save everything
+        for enriched in state["articles"]:
+            if "airline" in enriched["url"]:
+                enriched["error"] = "LLM timeout"
+            else:
+                enriched.update(sentiment="negative" if "storm" in enriched["url"] else "positive", summary=f"Summary of {enriched['url']}")
+        saved = await database.process(state)
+        assert saved["saved_count"] == 4, saved
+
+        async with open_session() as db:
+            stored = set((await db.execute(select(ArticleSignature.url))).scalars().all())
+            bands = await db.scalar(select(func.count()).select_from(ArticleBand))
+        assert stored == {"https://a.example/storm", "https://a.example/museum", "https://a.example/airline"}, stored
+        assert bands > 0
+
+        # Second run, with nothing kept in memory: copies are matched through the stored signatures
+        volcano = ("Volcano eruption grounds flights across the northern islands",
+                   "Ash from the eruption closed three airports and stranded thousands of travellers on the northern islands.")
+        state = await DeduplicatorAgent({"dedupe_threshold": 0.6}).process({"articles": [
+            article("https://c.example/storm", f"{storm[0]} - AP", storm[1][:100]),
+            article("https://b.example/airline", f"{airline[0]} - BBC News", airline[1]),
+            article("https://a.example/volcano", *volcano),
+        ]})
+        [copy] = state["duplicates"]
+        assert copy["url"] == "https://c.example/storm" and copy["canonical_url"] == "https://a.example/storm", copy
+        assert (copy["sentiment"], copy["summary"]) == ("negative", "Summary of https://a.example/storm"), copy
+        # A canonical whose enrichment failed has nothing to reuse, so its copy is enriched itself
+        assert [a["url"] for a in state["articles"]] == ["https://b.example/airline", "https://a.example/volcano"], state["articles"]
+    finally:
+        await write_queue.stop()
+
+async def main() -> None:
+    stream = make_stream()
+    print(f"articles={len(stream)} stories={STORIES}")
+    for threshold, (min_precision, min_recall) in MIN_QUALITY.items():
+        result = evaluate(stream, threshold)
+        # Separate enrichment makes one sentiment and one summary call per article
+        print(
+            f"threshold={threshold:.1f}  precision={result['precision']:.3f}  recall={result['recall']:.3f}  "
+            f"llm_calls={2 * (len(stream) - result['linked'])} (saved {2 * result['linked']} of {2 * len(stream)})  "
+            f"{result['us_per_article']:.0f}us/article"
+        )
+        assert result["precision"] >= min_precision, f"precision {result['precision']:.3f} < {min_precision} at threshold {threshold}"
+        assert result["recall"] >= min_recall, f"recall {result['recall']:.3f} < {min_recall} at threshold {threshold}"
+
+    configure(os.path.join(tempfile.mkdtemp(), "dedupe.db"))
+    await check_agent()
+    print("DeduplicatorAgent: in-batch links, stored signature lookup and enrichment reuse OK")
+
+if __name__ == "__main__":
+    asyncio.run(main())
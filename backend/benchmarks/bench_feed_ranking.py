@@ -0,0 +1,51 @@
+"""
+Latency of ranking /feed candidates for one user
+
+    cd backend && python -m benchmarks.bench_feed_ranking
+
+Builds a FeedIndex over synthetic articles and times FeedIndex.rank, which
+is the per-request work /feed does besides reading back the top rows.
+"""
+import random
+import statistics
+import time
+from app.feed.ranker import FeedIndex, FEED_WEIGHTS
+
+CANDIDATES = 100000
+ITERATIONS = 500
+TOP_K = 20
+CATEGORIES = ["business", "entertainment", "general", "health", "science", "sports", "technology"]
+SOURCES = [f"source-{i}" for i in range(300)]
+SENTIMENTS = ["positive", "negative", "neutral"]
+
+def main() -> None:
+    rng = random.Random(7)
+    now = time.time()
+
+    started = time.perf_counter()
+    index = FeedIndex(
+        ids=range(1, CANDIDATES + 1),
+        published_ts=[now - rng.uniform(0, 30 * 24 * 3600) for _ in range(CANDIDATES)],
+        categories=[rng.choice(CATEGORIES) for _ in range(CANDIDATES)],
+        sources=[rng.choice(SOURCES) for _ in range(CANDIDATES)],
+        sentiments=[rng.choice(SENTIMENTS) for _ in range(CANDIDATES)]
+    )
+    build_ms = (time.perf_counter() - started) * 1000
+
+    latencies = []
+    for _ in range(ITERATIONS):
+        interests = rng.sample(CATEGORIES, 3)
+        sources = [rng.choice(SOURCES) for _ in range(200)]
+        sentiments = [rng.choice(SENTIMENTS) for _ in range(200)]
+        started = time.perf_counter()
+        index.rank(interests, sources, sentiments, TOP_K, FEED_WEIGHTS, now=now)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"candidates={CANDIDATES} build={build_ms:.0f}ms  "
+        f"p50={quantiles[49]:.2f}ms  p95={quantiles[94]:.2f}ms  p99={quantiles[98]:.2f}ms"
+    )
+
+if __name__ == "__main__":
+    main()
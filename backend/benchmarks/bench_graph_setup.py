@@ -0,0 +1,64 @@
+"""
+Per-request setup cost of building the processing graph, and of new vs kept-alive connections
+
+    cd backend && python -m benchmarks.bench_graph_setup
+
+The first part times create_news_processing_graph (agents, ChatOpenAI
+clients, NewsAPITool and graph compilation), which the app now does once in
+its lifespan instead of on every cache miss. The second part times GETs
+against the local stub provider with a fresh httpx client per request versus
+one shared keep-alive client.
+"""
+import asyncio
+import os
+import statistics
+import time
+
+for key in ("openai_api_key", "news_api_key", "media_stack_api_key"):
+    os.environ.setdefault(key, "benchmark")
+
+import httpx
+from app.langgraph.graph import create_news_processing_graph
+from benchmarks.stub_providers import start_stub_server
+
+BUILDS = 30
+REQUESTS = 200
+
+def summarize(label: str, samples: list) -> None:
+    print(f"{label:<32} mean={statistics.mean(samples):7.2f}ms  p95={statistics.quantiles(samples, n=20)[-1]:7.2f}ms")
+
+async def time_graph_builds() -> None:
+    for mode in ("separate", "batched"):
+        samples = []
+        for _ in range(BUILDS):
+            started = time.perf_counter()
+            create_news_processing_graph({"openai_api_key": "benchmark", "enrichment_mode": mode})
+            samples.append((time.perf_counter() - started) * 1000)
+        summarize(f"build graph ({mode})", samples)
+
+async def time_connections(url: str) -> None:
+    fresh = []
+    for _ in range(REQUESTS):
+        started = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            await client.get(url, params={"categories": "general"})
+        fresh.append((time.perf_counter() - started) * 1000)
+    summarize("new client per request", fresh)
+
+    shared = []
+    async with httpx.AsyncClient() as client:
+        await client.get(url, params={"categories": "general"})
+        for _ in range(REQUESTS):
+            started = time.perf_counter()
+            await client.get(url, params={"categories": "general"})
+            shared.append((time.perf_counter() - started) * 1000)
+    summarize("shared keep-alive client", shared)
+
+async def main() -> None:
+    await time_graph_builds()
+    server = start_stub_server()
+    await time_connections(f"http://127.0.0.1:{server.server_address[1]}/v1/news")
+    server.shutdown()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+"""
+Overhead of the /metrics instrumentation
+
+    cd backend && python -m benchmarks.bench_metrics
+
+Times a histogram observation and a labelled counter increment, a batch of
+indexed SQLite SELECTs with and without the statement timing listeners, and
+rendering the registry once it holds a realistic number of series.
+"""
+import os
+import time
+
+for key in ("openai_api_key", "news_api_key", "media_stack_api_key"):
+    os.environ.setdefault(key, "benchmark")
+
+from sqlalchemy import create_engine, text
+from app.utils.metrics import Registry, instrument_engine
+
+OBSERVATIONS = 200000
+QUERIES = 20000
+
+def per_call(label: str, elapsed: float, calls: int) -> None:
+    print(f"{label:<36} {elapsed / calls * 1e9:8.0f}ns per call")
+
+def time_primitives() -> Registry:
+    registry = Registry()
+    histogram = registry.histogram("bench_duration_seconds", "Benchmark", ["node"])
+    counter = registry.counter("bench_total", "Benchmark", ["provider", "status"])
+
+    started = time.perf_counter()
+    for i in range(OBSERVATIONS):
+        histogram.observe(i % 1000 / 1000, "retrieve")
+    per_call("histogram observe", time.perf_counter() - started, OBSERVATIONS)
+
+    started = time.perf_counter()
+    for _ in range(OBSERVATIONS):
+        counter.inc("NewsAPI", "200")
+    per_call("counter inc", time.perf_counter() - started, OBSERVATIONS)
+    return registry
+
+def time_queries(instrumented: bool) -> float:
+    engine = create_engine("sqlite://")
+    if instrumented:
+        instrument_engine(engine)
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE news (id INTEGER PRIMARY KEY, title TEXT)"))
+        conn.execute(text("INSERT INTO news (title) VALUES (:title)"), [{"title": f"t{i}"} for i in range(1000)])
+        statement = text("SELECT title FROM news WHERE id = :id")
+        for i in range(QUERIES // 10):
+            conn.execute(statement, {"id": i % 1000 + 1}).scalar()
+        started = time.perf_counter()
+        for i in range(QUERIES):
+            conn.execute(statement, {"id": i % 1000 + 1}).scalar()
+        return time.perf_counter() - started
+
+def time_render(registry: Registry) -> None:
+    for node in ("retrieve", "prefilter", "dedupe", "analyze_sentiment", "summarize", "enrich", "save_to_db"):
+        registry.histogram(f"bench_{node}_seconds", "Benchmark", ["operation"]).observe(0.01, "SELECT")
+    started = time.perf_counter()
+    for _ in range(1000):
+        body = registry.render()
+    print(f"{'render registry':<36} {(time.perf_counter() - started):8.3f}ms per scrape ({len(body)} bytes)")
+
+if __name__ == "__main__":
+    registry = time_primitives()
+    plain = time_queries(False)
+    timed = time_queries(True)
+    per_call("SELECT by id (no listeners)", plain, QUERIES)
+    per_call("SELECT by id (timed)", timed, QUERIES)
+    print(f"{'statement timing overhead':<36} {(timed - plain) / QUERIES * 1e9:8.0f}ns per query")
+    time_render(registry)
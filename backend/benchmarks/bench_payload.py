@@ -0,0 +1,96 @@
+"""
+Bytes on the wire and server time for /news with field projection and compression
+
+    cd backend && python -m benchmarks.bench_payload [--db /tmp/load.db] [--requests 300]
+
+Calls the app in process for a user seeded by benchmarks.seed_data and reports,
+for the full article and for a title/source/image projection, the body size
+per encoding and the mean time per request. The /news response cache is
+disabled so every request runs the query and serialization. Before timing,
+every encoding is checked to decompress to the identity body, for /news and
+for the streamed /news/stream.
+"""
+import argparse
+import asyncio
+import gzip
+import os
+import statistics
+import tempfile
+import time
+
+PROJECTIONS = {
+    "all fields": None,
+    "title,source,image_url": "title,source,image_url",
+}
+
+def configure(db: str) -> None:
+    # Settings are read when the app modules are imported, so they are set first
+    path = os.path.abspath(db)
+    os.environ.update({
+        "database_url": f"sqlite:///{path}",
+        "async_database_url": f"sqlite+aiosqlite:///{path}",
+        "ingestion_enabled": "False",
+        "news_cache_ttl_seconds": "0",
+        "news_cache_stale_seconds": "0",
+    })
+    for key, value in (("secret", "benchmark"), ("algorithm", "HS256"), ("openai_api_key", "benchmark"),
+                       ("news_api_key", "benchmark"), ("media_stack_api_key", "benchmark")):
+        os.environ.setdefault(key, value)
+
+async def raw_body(client, path: str, params: dict, headers: dict, encoding: str) -> tuple:
+    """(Content-Encoding, body as sent) of one response; httpx would otherwise decode it"""
+    async with client.stream("GET", path, params=params, headers={**headers, "Accept-Encoding": encoding}) as response:
+        assert response.status_code == 200, f"{path} with {encoding}: {response.status_code}"
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+        return response.headers.get("content-encoding", "identity"), body
+
+async def check_round_trip(client, headers: dict, encodings: list, limit: int) -> None:
+    from app.utils.compression import brotli
+
+    decoders = {"identity": bytes, "gzip": gzip.decompress, "br": brotli.decompress if brotli is not None else None}
+    for path, params in (("/news", {"category": "all", "limit": limit}), ("/news/stream", {"limit": limit, "follow": "false"})):
+        _, expected = await raw_body(client, path, params, headers, "identity")
+        for encoding in encodings:
+            coding, body = await raw_body(client, path, params, headers, encoding)
+            assert coding == encoding, f"{path} with {encoding} came back as {coding}"
+            assert decoders[encoding](body) == expected, f"{path} with {encoding} does not decompress to the identity body"
+    print(f"round trip ok: {', '.join(encodings)}")
+
+async def main(requests: int, limit: int) -> None:
+    import httpx
+    from app.api import app
+    from app.utils.compression import brotli
+
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            login = (await client.post("/login", json={"email": "user0@example.com", "password": "password"})).json()
+            headers = {"Authorization": f"Bearer {login['access_token']}"}
+            await check_round_trip(client, headers, encodings, limit)
+
+            for label, fields in PROJECTIONS.items():
+                params = {"category": "all", "limit": limit, **({"fields": fields} if fields else {})}
+                for encoding in encodings:
+                    samples, size = [], 0
+                    for _ in range(requests):
+                        started = time.perf_counter()
+                        response = await client.get("/news", params=params, headers={**headers, "Accept-Encoding": encoding})
+                        samples.append((time.perf_counter() - started) * 1000)
+                        # httpx decodes the body, so the wire size comes from the raw stream
+                        size = int(response.headers.get("content-length", len(response.content)))
+                    print(f"{label:<24} {encoding:<9} {size:>8}B  mean={statistics.mean(samples):6.2f}ms  p50={statistics.median(samples):6.2f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", help="Seeded database; generated when missing")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--limit", type=int, default=200)
+    args = parser.parse_args()
+
+    db = args.db or os.path.join(tempfile.mkdtemp(), "payload.db")
+    if not os.path.exists(db):
+        from benchmarks.seed_data import seed_database
+        print(f"seeded {db}: {seed_database(db, 100, 20000)}")
+    configure(db)
+    asyncio.run(main(args.requests, args.limit))
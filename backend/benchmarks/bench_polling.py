@@ -0,0 +1,72 @@
+"""
+Polling cost of /news and /bookmarks with and without ETag revalidation
+
+    cd backend && python -m benchmarks.bench_polling [--db /tmp/load.db] [--requests 2000]
+
+Calls the app in process (no sockets, so the numbers are the server-side cost
+per poll) for a user seeded by benchmarks.seed_data. "full" sends no
+validator and gets the whole page every time; "revalidate" sends the ETag
+from the previous response and gets 304 Not Modified while nothing changed.
+For throughput over real connections use benchmarks.load_test --revalidate.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+def configure(db: str) -> None:
+    # Settings are read when the app modules are imported, so they are set first
+    path = os.path.abspath(db)
+    os.environ.update({
+        "database_url": f"sqlite:///{path}",
+        "async_database_url": f"sqlite+aiosqlite:///{path}",
+        "ingestion_enabled": "False",
+    })
+    for key, value in (("secret", "benchmark"), ("algorithm", "HS256"), ("openai_api_key", "benchmark"),
+                       ("news_api_key", "benchmark"), ("media_stack_api_key", "benchmark")):
+        os.environ.setdefault(key, value)
+
+async def poll(client, path: str, params: dict, headers: dict, requests: int, revalidate: bool) -> tuple:
+    etag, samples, sizes = None, [], []
+    for _ in range(requests):
+        request_headers = {**headers, "If-None-Match": etag} if revalidate and etag else headers
+        started = time.perf_counter()
+        response = await client.get(path, params=params, headers=request_headers)
+        samples.append((time.perf_counter() - started) * 1000)
+        sizes.append(len(response.content))
+        etag = response.headers.get("etag", etag)
+    return samples, statistics.mean(sizes)
+
+async def main(requests: int) -> None:
+    import httpx
+    from app.api import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            login = (await client.post("/login", json={"email": "user0@example.com", "password": "password"})).json()
+            headers = {"Authorization": f"Bearer {login['access_token']}"}
+
+            for path, params in (("/news", {"category": "technology", "limit": 50}), ("/bookmarks", {"limit": 50})):
+                for mode in ("full", "revalidate"):
+                    samples, size = await poll(client, path, params, headers, requests, mode == "revalidate")
+                    total = sum(samples) / 1000
+                    print(
+                        f"{path:<11} {mode:<11} {requests / total:8.0f} polls/s  p50={statistics.median(samples):6.2f}ms  "
+                        f"p99={statistics.quantiles(samples, n=100)[98]:6.2f}ms  body={size:8.0f}B"
+                    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", help="Seeded database; generated when missing")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = args.db or os.path.join(tempfile.mkdtemp(), "polling.db")
+    if not os.path.exists(db):
+        from benchmarks.seed_data import seed_database
+        print(f"seeded {db}: {seed_database(db, 100, 20000)}")
+    configure(db)
+    asyncio.run(main(args.requests))
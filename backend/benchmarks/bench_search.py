@@ -0,0 +1,104 @@
+"""
+Latency of /news/search queries over a large article corpus
+
+    cd backend && python -m benchmarks.bench_search [articles]
+
+Seeds a temporary SQLite database (default one million articles), builds the
+FTS5 index and times the same queries /news/search runs: common and rare
+terms, multi-word and prefix queries, filters and a second page, with the
+default search_max_candidates bound.
+"""
+import itertools
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, create_db_engine
+from app.models.news import News
+from app.response_schemas import NewsSchema, schema_columns
+from app.utils.search import ensure_search_index, match_expression, candidate_floor, search_query
+
+ARTICLES = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+REPEAT = 50
+MAX_CANDIDATES = 5000
+VOCABULARY = [f"term{i}" for i in range(20000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+CATEGORIES = ["business", "entertainment", "general", "health", "science", "sports", "technology"]
+SENTIMENTS = ["positive", "negative", "neutral"]
+
+QUERIES = [
+    ("rare term", {"q": "term15000"}),
+    ("mid term", {"q": "term500"}),
+    ("common term", {"q": "term3"}),
+    ("two terms", {"q": "term40 term90"}),
+    ("prefix", {"q": "term1234*"}),
+    ("mid + category", {"q": "term500", "category": "sports"}),
+    ("mid + sentiment + date", {"q": "term500", "sentiment": "positive", "published_from": datetime(2024, 6, 1)}),
+]
+
+def seed(engine) -> None:
+    rng = random.Random(3)
+    start = datetime(2024, 1, 1)
+    raw = engine.raw_connection()
+    cursor = raw.cursor()
+    columns = "title, summary, url, published_at, sentiment, source, category, processing_status"
+    for offset in range(0, ARTICLES, 50000):
+        cursor.executemany(
+            f"INSERT INTO news ({columns}) VALUES (?, ?, ?, ?, ?, ?, ?, 'completed')",
+            [(
+                " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=8)),
+                " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=30)),
+                f"https://example.com/{i}",
+                (start + timedelta(seconds=i * 30)).isoformat(sep=" "),
+                rng.choice(SENTIMENTS),
+                f"source-{i % 200}",
+                rng.choice(CATEGORIES),
+            ) for i in range(offset, min(offset + 50000, ARTICLES))]
+        )
+    raw.commit()
+    raw.close()
+
+def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "search.db")
+    engine = create_db_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine, tables=[News.__table__])
+
+    started = time.perf_counter()
+    seed(engine)
+    seeded = time.perf_counter() - started
+    ensure_search_index(engine)
+    print(f"articles={ARTICLES} seed={seeded:.1f}s index={time.perf_counter() - started - seeded:.1f}s")
+
+    columns = schema_columns(News, NewsSchema)
+    session = sessionmaker(bind=engine)()
+    for label, params in QUERIES:
+        params = dict(params)
+        match = match_expression(params.pop("q"))
+        latencies, rows = [], []
+        for _ in range(REPEAT):
+            began = time.perf_counter()
+            min_id = session.scalar(candidate_floor(match, MAX_CANDIDATES))
+            rows = session.execute(search_query(columns, match, 21, min_id=min_id, **params)).all()
+            latencies.append((time.perf_counter() - began) * 1000)
+
+        # The next page continues after the last row of the first one
+        page_two = []
+        if len(rows) > 20:
+            after = (rows[19].rank, rows[19].id)
+            for _ in range(REPEAT):
+                began = time.perf_counter()
+                session.execute(search_query(columns, match, 21, after=after, min_id=min_id, **params)).all()
+                page_two.append((time.perf_counter() - began) * 1000)
+
+        print(
+            f"{label:<24} p50={statistics.median(latencies):7.2f}ms  p95={statistics.quantiles(latencies, n=20)[-1]:7.2f}ms"
+            + (f"  page2_p50={statistics.median(page_two):7.2f}ms" if page_two else "")
+        )
+    session.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Time serializing a page of 1,000 articles, before and after the typed response path
+
+    cd backend && python -m benchmarks.bench_serialization
+"""
+import time
+from datetime import datetime, timedelta
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models.news import News
+from app.response_schemas import NewsSchema, schema_columns, serialize_many
+from app.utils.responses import ORJSONResponse
+
+ARTICLES = 1000
+ROUNDS = 20
+
+def seed(session) -> None:
+    now = datetime(2024, 1, 1)
+    session.add_all(News(
+        title=f"Headline number {i} about markets and technology",
+        summary="A two to three sentence summary of the article. " * 3,
+        image_url=f"https://example.com/images/{i}.jpg",
+        url=f"https://example.com/articles/{i}",
+        published_at=now - timedelta(minutes=i),
+        sentiment="neutral",
+        source="example",
+        category="technology",
+        processing_status="completed"
+    ) for i in range(ARTICLES))
+    session.commit()
+
+def orm_and_jsonable_encoder(session) -> bytes:
+    items = session.query(News).order_by(News.published_at.desc()).all()
+    body = JSONResponse(jsonable_encoder({"data": items, "count": len(items), "success": True})).body
+    session.expunge_all()
+    return body
+
+def columns_and_orjson(session) -> bytes:
+    rows = session.query(*schema_columns(News, NewsSchema)).order_by(News.published_at.desc()).all()
+    return ORJSONResponse({"data": serialize_many(NewsSchema, rows), "count": len(rows), "success": True}).body
+
+def measure(name: str, fn, session) -> None:
+    fn(session)
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        body = fn(session)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    print(f"{name:<28} {elapsed * 1000:8.2f} ms per {ARTICLES} articles  ({len(body)} bytes)")
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    seed(session)
+    session.expunge_all()
+
+    measure("ORM + jsonable_encoder", orm_and_jsonable_encoder, session)
+    measure("columns + schema + orjson", columns_and_orjson, session)
+
+if __name__ == "__main__":
+    main()
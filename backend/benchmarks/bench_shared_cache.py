@@ -0,0 +1,90 @@
+"""
+Per-process TTLCache against the SQLite cache shared by all workers
+
+    cd backend && python -m benchmarks.bench_shared_cache [--workers 4] [--pages 200]
+
+Times a cache hit for a 50-article /news page in each backend, then runs
+--workers processes that each read the same --pages pages through their own
+cache, each starting at a different page, with a loader that stands in for a
+5ms database query. A per-process cache loads every page once per worker; the
+shared one about once in total.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+from app.utils.cache import TTLCache
+from app.utils.shared_cache import SQLiteCache
+
+HITS = 5000
+LOAD_SECONDS = 0.005
+
+def make_page(page: int, size: int = 50) -> dict:
+    data = [{
+        "id": page * size + i,
+        "title": f"Council approves budget for harbor railway and glacier museum {page}-{i}",
+        "summary": "A short summary of the article, a couple of sentences long, as the summarizer writes it. " * 2,
+        "image_url": f"https://images.example.com/{page}/{i}.jpg",
+        "url": f"https://news.example.com/{page}/{i}",
+        "published_at": "2024-01-01T00:00:00",
+        "sentiment": "neutral",
+        "source": "example-source",
+        "category": "technology",
+    } for i in range(size)]
+    return {"data": data, "count": size, "next_cursor": f"cursor-{page}", "success": True}
+
+def make_cache(backend: str, path: str):
+    if backend == "sqlite":
+        return SQLiteCache(path, ttl_seconds=300)
+    return TTLCache(ttl_seconds=300)
+
+async def time_hits(backend: str, path: str) -> None:
+    cache = make_cache(backend, path)
+    page = make_page(0)
+
+    async def load() -> dict:
+        return page
+
+    await cache.get_or_load("news_0", load)
+    started = time.perf_counter()
+    for _ in range(HITS):
+        await cache.get_or_load("news_0", load)
+    print(f"{backend + ' hit':<24} {(time.perf_counter() - started) / HITS * 1e6:8.1f}us per lookup")
+
+def run_worker(backend: str, path: str, pages: int, start: int) -> int:
+    async def main() -> int:
+        cache = make_cache(backend, path)
+        loads = 0
+
+        async def load(page: int) -> dict:
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(LOAD_SECONDS)
+            return make_page(page)
+
+        for page in ((start + offset) % pages for offset in range(pages)):
+            await cache.get_or_load(f"news_{page}", lambda page=page: load(page))
+        return loads
+
+    return asyncio.run(main())
+
+def time_workers(backend: str, path: str, workers: int, pages: int) -> None:
+    started = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        loads = pool.starmap(run_worker, [(backend, path, pages, index * pages // workers) for index in range(workers)])
+    elapsed = time.perf_counter() - started
+    print(f"{backend + ' x' + str(workers):<24} {sum(loads):5d} loads for {pages} pages  {elapsed:6.2f}s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in ("memory", "sqlite"):
+            asyncio.run(time_hits(backend, os.path.join(directory, "hits.db")))
+        for backend in ("memory", "sqlite"):
+            time_workers(backend, os.path.join(directory, "workers.db"), args.workers, args.pages)
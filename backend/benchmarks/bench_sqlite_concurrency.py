@@ -0,0 +1,118 @@
+"""
+Mixed read/write load against the plain SQLite setup and the tuned profile
+
+    cd backend && python -m benchmarks.bench_sqlite_concurrency
+
+Readers page through the feed while ingestion-style writers upsert batches.
+The plain profile writes from every writer directly, the tuned profile
+funnels writes through a WriteQueue.
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database import Base, WriteQueue, create_db_engine
+from app.models.news import News
+
+SEED_ROWS = 20000
+READERS = 16
+WRITERS = 4
+BATCH = 50
+DURATION = 5.0
+
+def make_rows(start: int, count: int) -> list:
+    now = datetime(2024, 1, 1)
+    return [{
+        "title": f"Headline {i}",
+        "summary": "Summary text " * 10,
+        "image_url": None,
+        "url": f"https://example.com/{i}",
+        "published_at": now - timedelta(seconds=i),
+        "sentiment": "neutral",
+        "source": "example",
+        "category": ("business", "sports", "technology")[i % 3],
+        "processing_status": "completed",
+    } for i in range(start, start + count)]
+
+def upsert(rows: list):
+    statement = insert(News).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[News.url],
+        set_={"summary": statement.excluded.summary}
+    )
+
+async def run_profile(profile: str) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    sync_engine = create_db_engine(f"sqlite:///{path}", profile=profile)
+    Base.metadata.create_all(bind=sync_engine)
+    with sync_engine.begin() as connection:
+        for start in range(0, SEED_ROWS, 500):
+            connection.execute(upsert(make_rows(start, 500)))
+    sync_engine.dispose()
+
+    engine = create_db_engine(f"sqlite+aiosqlite:///{path}", profile=profile, pool_size=READERS + WRITERS)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    queue = WriteQueue(sessions) if profile == "tuned" else None
+
+    read_latencies, write_latencies = [], []
+    errors = {"read": 0, "write": 0}
+    deadline = time.perf_counter() + DURATION
+
+    async def reader(index: int) -> None:
+        category = ("business", "sports", "technology")[index % 3]
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                async with sessions() as db:
+                    await db.execute(select(News.id, News.title).where(
+                        News.category == category,
+                        News.processing_status == "completed"
+                    ).order_by(News.published_at.desc()).limit(50))
+                read_latencies.append(time.perf_counter() - started)
+            except Exception:
+                errors["read"] += 1
+
+    async def writer(index: int) -> None:
+        start = SEED_ROWS + index * 1_000_000
+        while time.perf_counter() < deadline:
+            statement = upsert(make_rows(start, BATCH))
+            start += BATCH
+            started = time.perf_counter()
+            try:
+                if queue:
+                    async def save(db, statement=statement):
+                        await db.execute(statement)
+                    await queue.submit(save)
+                else:
+                    async with sessions() as db:
+                        await db.execute(statement)
+                        await db.commit()
+                write_latencies.append(time.perf_counter() - started)
+            except Exception:
+                errors["write"] += 1
+
+    await asyncio.gather(*(reader(i) for i in range(READERS)), *(writer(i) for i in range(WRITERS)))
+    if queue:
+        await queue.stop()
+    await engine.dispose()
+
+    def p95(values: list) -> float:
+        return statistics.quantiles(values, n=20)[-1] * 1000 if len(values) > 1 else 0.0
+
+    print(
+        f"{profile:<6} reads/s={len(read_latencies) / DURATION:8.1f}  read_p95={p95(read_latencies):7.2f}ms  "
+        f"writes/s={len(write_latencies) / DURATION:6.1f}  write_p95={p95(write_latencies):7.2f}ms  "
+        f"errors={errors}"
+    )
+
+async def main() -> None:
+    for profile in ("plain", "tuned"):
+        await run_profile(profile)
+
+if __name__ == "__main__":
+    asyncio.run(main())
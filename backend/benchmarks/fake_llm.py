@@ -0,0 +1,74 @@
+import asyncio
+import json
+import random
+import re
+from typing import Any, List
+from langchain_core.messages import AIMessage
+
+class FakeChatModel:
+    """Stand-in for ChatOpenAI that answers the pipeline prompts after a simulated delay"""
+
+    def __init__(self, min_latency: float = 0.05, max_latency: float = 0.25, failure_rate: float = 0.0, seed: int = 0):
+        self.min_latency = min_latency
+        self.max_latency = max_latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.calls = 0
+        self.total_latency = 0.0
+
+    def respond(self, prompt: str) -> str:
+        if "Analyze and summarize each" in prompt:
+            indexes = [int(index) for index in re.findall(r"^Article (\d+):", prompt, re.MULTILINE)]
+            return json.dumps({"results": [{
+                "index": index,
+                "sentiment": self.random.choice(["positive", "negative", "neutral"]),
+                "summary": "A short summary of the article."
+            } for index in indexes]})
+        if "Analyze the sentiment" in prompt:
+            return json.dumps({"sentiment": self.random.choice(["positive", "negative", "neutral"])})
+        return "A short summary of the article."
+
+    async def ainvoke(self, messages: List[Any], **kwargs: Any) -> AIMessage:
+        self.calls += 1
+        latency = self.random.uniform(self.min_latency, self.max_latency)
+        self.total_latency += latency
+        await asyncio.sleep(latency)
+
+        if self.random.random() < self.failure_rate:
+            raise RuntimeError("fake LLM failure")
+
+        prompt = "\n".join(str(message.content) for message in messages)
+        content = self.respond(prompt)
+        # Rough whitespace token counts so token usage metrics have something to report
+        input_tokens, output_tokens = len(prompt.split()), len(content.split())
+        return AIMessage(content=content, usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens
+        })
+
+def make_articles(count: int, category: str = "technology") -> List[dict]:
+    return [{
+        "title": f"Article {i} about {category}",
+        "description": f"Description of article {i}",
+        "url": f"https://example.com/{category}/{i}",
+        "image_url": None,
+        "published_at": "2024-01-01T00:00:00",
+        "source": "example",
+        "category": category,
+    } for i in range(count)]
+
+def install_fake_llm(min_latency: float = 0.05, max_latency: float = 0.25, failure_rate: float = 0.0, seed: int = 0) -> List[FakeChatModel]:
+    """Make every agent built from now on use a FakeChatModel; returns the models for inspection"""
+    from app.langgraph.agents import analyzer, summarizer, enricher
+
+    models = []
+
+    def factory(**kwargs: Any) -> FakeChatModel:
+        model = FakeChatModel(min_latency, max_latency, failure_rate, seed + len(models))
+        models.append(model)
+        return model
+
+    for module in (analyzer, summarizer, enricher):
+        module.ChatOpenAI = factory
+    return models
@@ -0,0 +1,253 @@
+"""
+Drive /news, /bookmarks and /interests at a fixed concurrency and record latency percentiles
+
+    cd backend && python -m benchmarks.load_test --concurrency 32 --duration 15
+    cd backend && python -m benchmarks.load_test --compare before.json after.json
+
+Without --base-url a database is generated with benchmarks.seed_data (or
+reused with --db) and the app is started offline via benchmarks.serve.
+Each scenario runs for --duration seconds after a short warm-up; throughput
+and p50/p95/p99 latency per scenario are printed and saved as JSON.
+
+With --revalidate every client polls like a caching client: it keeps the ETag
+of each URL it fetched and sends it back in If-None-Match, so unchanged pages
+come back as 304. Compare polling with and without it:
+    cd backend && python -m benchmarks.load_test --db /tmp/load.db --scenarios news,bookmarks --output plain.json
+    cd backend && python -m benchmarks.load_test --db /tmp/load.db --scenarios news,bookmarks --revalidate --output etag.json
+    cd backend && python -m benchmarks.load_test --compare plain.json etag.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+import httpx
+
+CATEGORIES = ["all", "general", "business", "entertainment", "health", "science", "technology", "sports"]
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+Request = Tuple[str, str, Dict[str, Any]]
+
+def news_request(rng: random.Random, user: dict) -> Request:
+    return "GET", "/news", {"params": {"category": rng.choice(CATEGORIES), "limit": 50}}
+
+def bookmarks_request(rng: random.Random, user: dict) -> Request:
+    return "GET", "/bookmarks", {"params": {"limit": 50}}
+
+def interests_request(rng: random.Random, user: dict) -> Request:
+    return "GET", "/interests", {}
+
+def mixed_request(rng: random.Random, user: dict) -> Request:
+    roll = rng.random()
+    if roll < 0.5:
+        return news_request(rng, user)
+    if roll < 0.7:
+        return bookmarks_request(rng, user)
+    if roll < 0.8:
+        return interests_request(rng, user)
+    if roll < 0.9:
+        return "GET", "/users/me/interests", {}
+    # Bookmark writes against recent articles
+    method = "POST" if rng.random() < 0.5 else "DELETE"
+    return method, f"/bookmarks/{user['max_news_id'] - int(rng.expovariate(1 / 500))}", {}
+
+SCENARIOS: Dict[str, Callable[[random.Random, dict], Request]] = {
+    "news": news_request,
+    "bookmarks": bookmarks_request,
+    "interests": interests_request,
+    "mixed": mixed_request,
+}
+
+def percentile(values: List[float], q: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+async def run_scenario(
+    base_url: str,
+    users: List[dict],
+    name: str,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    revalidate: bool = False
+) -> dict:
+    make_request = SCENARIOS[name]
+    latencies: List[float] = []
+    errors = not_modified = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        measure_from = started + warmup
+        deadline = measure_from + duration
+
+        async def worker(index: int) -> None:
+            nonlocal errors, not_modified
+            rng = random.Random(index)
+            user = users[index % len(users)]
+            etags: Dict[str, str] = {}
+            while True:
+                now = time.perf_counter()
+                if now >= deadline:
+                    return
+                method, path, options = make_request(rng, user)
+                headers = user["headers"]
+                url_key = f"{path}?{sorted(options.get('params', {}).items())}"
+                if revalidate and method == "GET" and url_key in etags:
+                    headers = {**headers, "If-None-Match": etags[url_key]}
+                try:
+                    response = await client.request(method, path, headers=headers, **options)
+                    ok = response.status_code < 400
+                    if revalidate and "etag" in response.headers:
+                        etags[url_key] = response.headers["etag"]
+                except httpx.HTTPError:
+                    ok = False
+                    response = None
+                finished = time.perf_counter()
+                if now >= measure_from:
+                    latencies.append((finished - now) * 1000)
+                    errors += not ok
+                    not_modified += response is not None and response.status_code == 304
+
+        await asyncio.gather(*(worker(index) for index in range(concurrency)))
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "not_modified": not_modified,
+        "throughput_rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies, default=0.0), 2),
+    }
+
+async def login(base_url: str, count: int) -> List[dict]:
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        users = []
+        for i in range(count):
+            response = await client.post("/login", json={"email": f"user{i}@example.com", "password": "password"})
+            body = response.json()
+            if not body.get("success"):
+                break
+            users.append({"headers": {"Authorization": f"Bearer {body['access_token']}"}})
+
+        newest = (await client.get("/news", params={"limit": 1}, headers=users[0]["headers"])).json() if users else {}
+        max_news_id = max((item["id"] for item in newest.get("data", [])), default=1)
+    if not users:
+        raise RuntimeError("No seeded users could log in; seed the database with benchmarks.seed_data")
+    for user in users:
+        user["max_news_id"] = max_news_id
+    return users
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(db: str, port: int) -> subprocess.Popen:
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.serve", "--db", db, "--port", str(port)],
+        cwd=backend
+    )
+    for _ in range(300):
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            raise RuntimeError("The API process exited during startup")
+        time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("The API did not start in time")
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file)["results"], json.load(after_file)["results"]
+    for name in after:
+        if name not in before:
+            continue
+        changes = "  ".join(
+            f"{metric}={before[name][metric]}->{after[name][metric]} ({(after[name][metric] / before[name][metric] - 1) * 100:+.0f}%)"
+            for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms") if before[name][metric]
+        )
+        print(f"{name:<10} {changes}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", help="Target an already running API seeded by benchmarks.seed_data")
+    parser.add_argument("--db", help="Seeded database to serve; generated when missing")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--login-users", type=int, default=100)
+    parser.add_argument("--scenarios", default="news,bookmarks,interests,mixed")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--revalidate", action="store_true", help="Send If-None-Match with the last ETag seen for each URL")
+    parser.add_argument("--output", help="JSON results path (default benchmarks/results/load_<timestamp>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        return compare(*args.compare)
+
+    process, dataset = None, None
+    base_url = args.base_url
+    if not base_url:
+        db = args.db or os.path.join(tempfile.mkdtemp(), "load.db")
+        if not os.path.exists(db):
+            from benchmarks.seed_data import seed_database
+            dataset = seed_database(db, args.users, args.articles)
+            print(f"seeded {db}: {dataset}")
+        port = free_port()
+        process = start_server(db, port)
+        base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        users = asyncio.run(login(base_url, args.login_users))
+        results = {}
+        for name in args.scenarios.split(","):
+            results[name] = asyncio.run(run_scenario(
+                base_url, users, name, args.concurrency, args.duration, args.warmup, args.revalidate
+            ))
+            result = results[name]
+            print(
+                f"{name:<10} rps={result['throughput_rps']:8.1f}  p50={result['p50_ms']:7.2f}ms  "
+                f"p95={result['p95_ms']:7.2f}ms  p99={result['p99_ms']:7.2f}ms  errors={result['errors']}  304s={result['not_modified']}"
+            )
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+
+    output = args.output or os.path.join(RESULTS_DIR, f"load_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as results_file:
+        json.dump({
+            "timestamp": datetime.now().isoformat(),
+            "commit": commit,
+            "settings": {key: value for key, value in vars(args).items() if key != "compare"},
+            "dataset": dataset,
+            "results": results,
+        }, results_file, indent=2)
+    print(f"saved {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Generate a realistic SQLite database for load tests
+
+    cd backend && python -m benchmarks.seed_data --db /tmp/load.db --users 1000 --articles 50000
+
+Users (password "password", emails user<N>@example.com) follow 1-4 interests
+and bookmark a skewed share of recent articles. Articles are spread over the
+last 30 days across every category, with a long tail of sources.
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+for key, value in (("secret", "benchmark"), ("algorithm", "HS256")):
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import insert, select
+from app.database import Base, create_db_engine
+from app.auth.auth_handler import hash_password
+from app.models.user import User
+from app.models.interest import Interest, user_interests
+from app.models.news import News
+from app.models.bookmark import Bookmark
+from app.utils.search import ensure_search_index
+from benchmarks.stub_providers import make_story
+
+CATEGORIES = ["general", "business", "entertainment", "health", "science", "technology", "sports"]
+SOURCES = [f"{name} {kind}" for name in ("Daily", "Global", "Metro", "National", "Evening", "Morning", "City", "Pacific")
+           for kind in ("Times", "Post", "Herald", "Wire", "Journal")]
+SENTIMENTS = ["positive", "negative", "neutral"]
+PASSWORD = "password"
+
+def seed_database(path: str, users: int = 1000, articles: int = 50000, max_bookmarks: int = 40, seed: int = 1) -> Dict[str, Any]:
+    """Create the schema at path and fill it; returns a summary of what was generated"""
+    rng = random.Random(seed)
+    engine = create_db_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    now = datetime.now()
+
+    with engine.begin() as connection:
+        connection.execute(insert(Interest), [{"name": name} for name in CATEGORIES])
+        interest_ids = dict(connection.execute(select(Interest.name, Interest.id)).all())
+
+        password = hash_password(PASSWORD)
+        connection.execute(insert(User), [{
+            "firstname": f"User{i}",
+            "lastname": "Load",
+            "email": f"user{i}@example.com",
+            "password": password,
+        } for i in range(users)])
+        user_ids = connection.execute(select(User.id).order_by(User.id)).scalars().all()
+
+        memberships = []
+        for user_id in user_ids:
+            for name in rng.sample(CATEGORIES, rng.randint(1, 4)):
+                memberships.append({"user_id": user_id, "interest_id": interest_ids[name]})
+        connection.execute(insert(user_interests), memberships)
+
+        # Popular sources publish most of the articles
+        source_weights = [1 / (rank + 1) for rank in range(len(SOURCES))]
+        for offset in range(0, articles, 5000):
+            rows = []
+            for i in range(offset, min(offset + 5000, articles)):
+                category = rng.choice(CATEGORIES)
+                story = make_story(category, i)
+                rows.append({
+                    "title": story["title"],
+                    "summary": story["description"],
+                    "image_url": f"https://images.example.com/{i}.jpg",
+                    "url": f"https://news.example.com/{category}/{i}",
+                    "published_at": now - timedelta(seconds=rng.uniform(0, 30 * 24 * 3600)),
+                    "sentiment": rng.choices(SENTIMENTS, weights=[3, 3, 4])[0],
+                    "source": rng.choices(SOURCES, weights=source_weights)[0],
+                    "category": category,
+                    "processing_status": "completed",
+                })
+            connection.execute(insert(News), rows)
+
+        # Most bookmarks point at recent articles, a few users bookmark heavily
+        bookmarks = set()
+        for user_id in user_ids:
+            count = min(int(rng.lognormvariate(1.5, 1.0)), max_bookmarks)
+            for _ in range(count):
+                bookmarks.add((user_id, articles - int(rng.expovariate(1 / max(articles / 10, 1))) % articles))
+        if bookmarks:
+            connection.execute(insert(Bookmark), [{"user_id": user_id, "news_id": news_id} for user_id, news_id in bookmarks])
+
+    ensure_search_index(engine)
+    engine.dispose()
+
+    return {
+        "users": users,
+        "interests": len(memberships),
+        "articles": articles,
+        "bookmarks": len(bookmarks),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", required=True)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--max-bookmarks", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        parser.error(f"{args.db} already exists")
+    print(seed_database(args.db, args.users, args.articles, args.max_bookmarks, args.seed))
@@ -0,0 +1,68 @@
+"""
+Run the API fully offline: stub news providers, a fake LLM and a chosen database
+
+    cd backend && python -m benchmarks.serve --db /tmp/load.db --port 8000
+
+Ingestion is off unless --ingestion is given; with it, the scheduler fetches
+from the local stub providers and enriches through FakeChatModel. With
+--workers N the workers share an SQLite news cache next to the database, and
+only the elected leader ingests.
+"""
+import argparse
+import json
+import os
+
+def create_app():
+    """App factory for each worker process, which installs its own fake LLM"""
+    from benchmarks.fake_llm import install_fake_llm
+    install_fake_llm(*json.loads(os.environ["benchmark_fake_llm"]))
+
+    from app.api import app
+    return app
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", required=True)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--ingestion", action="store_true")
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--provider-latency", type=float, default=0.05)
+    parser.add_argument("--provider-failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    from benchmarks.stub_providers import start_stub_server
+    stub = start_stub_server(0, args.provider_latency, args.provider_failure_rate)
+    stub_url = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    # Settings are read when the app modules are imported, so they are set first
+    path = os.path.abspath(args.db)
+    os.environ.update({
+        "database_url": f"sqlite:///{path}",
+        "async_database_url": f"sqlite+aiosqlite:///{path}",
+        "mediastack_url": f"{stub_url}/v1/news",
+        "newsapi_url": f"{stub_url}/v2/everything",
+        "ingestion_enabled": str(args.ingestion),
+        "leader_lock_path": f"{path}.lock",
+        "benchmark_fake_llm": json.dumps([args.llm_latency / 2, args.llm_latency * 1.5, args.llm_failure_rate]),
+    })
+    if args.workers > 1:
+        os.environ.setdefault("news_cache_backend", "sqlite")
+        os.environ.setdefault("news_cache_path", f"{path}.cache")
+    for key, value in (("secret", "benchmark"), ("algorithm", "HS256"), ("openai_api_key", "benchmark"),
+                       ("news_api_key", "benchmark"), ("media_stack_api_key", "benchmark")):
+        os.environ.setdefault(key, value)
+
+    import uvicorn
+    if args.workers > 1:
+        # Create the schema once here, before the workers start and would race to create it
+        import app.api  # noqa: F401
+        uvicorn.run("benchmarks.serve:create_app", factory=True, workers=args.workers,
+                    host=args.host, port=args.port, log_level="warning")
+    else:
+        uvicorn.run(create_app(), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
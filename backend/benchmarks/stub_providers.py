@@ -0,0 +1,185 @@
+"""
+Local stand-in for the MediaStack and NewsAPI endpoints
+
+    cd backend && python -m benchmarks.stub_providers --port 8090
+
+Then point the app at it with
+    mediastack_url=http://127.0.0.1:8090/v1/news
+    newsapi_url=http://127.0.0.1:8090/v2/everything
+    rss_feeds=technology=http://127.0.0.1:8090/rss/technology,http://127.0.0.1:8090/atom/general
+
+Feeds take ?count= (default 50) and answer conditional GETs with 304.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List
+from urllib.parse import urlparse, parse_qs
+from xml.sax.saxutils import escape
+
+WORDS = (
+    "market council storm election league vaccine startup court river budget senate rally "
+    "drought merger satellite strike festival museum tariff reactor transfer verdict harbor "
+    "pipeline protest summit glacier airline treaty wildfire robot stadium bank coach album "
+    "outbreak rover scandal harvest railway bond pitcher nurse drone mayor coral trial chip"
+).split()
+
+def make_story(category: str, i: int) -> Dict[str, str]:
+    """Distinct headline per (category, i); both providers carry the same story i"""
+    rng = random.Random(f"{category}-{i}")
+    return {
+        "title": " ".join(rng.sample(WORDS, 7)).capitalize(),
+        "description": " ".join(rng.sample(WORDS, 14)).capitalize() + ".",
+    }
+
+def make_items(category: str, count: int, provider: str) -> List[Dict[str, Any]]:
+    now = datetime(2024, 1, 1)
+    return [{
+        # Syndicated copies differ by URL and a trailing source name
+        "title": f"{make_story(category, i)['title']} - {provider.title()}",
+        "description": make_story(category, i)["description"],
+        "url": f"https://{provider}.example.com/{category}/{i}",
+        "image": f"https://{provider}.example.com/{category}/{i}.jpg",
+        "published_at": (now - timedelta(minutes=i)).isoformat(),
+        "source": f"{provider}-source-{i % 5}",
+    } for i in range(count)]
+
+def make_feed(category: str, count: int, provider: str = "feed", atom: bool = False) -> bytes:
+    """An RSS 2.0 or Atom document with count entries, newest first"""
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    parts = []
+    for i in range(count):
+        story = make_story(category, i)
+        title = escape(f"{story['title']} - {provider.title()}")
+        # Descriptions carry markup, as most real feeds do
+        description = escape(f"<p>{story['description']}</p>")
+        url = f"https://{provider}.example.com/{category}/{i}"
+        published = now - timedelta(minutes=i)
+        if atom:
+            parts.append(
+                f"<entry><title>{title}</title><link href=\"{url}\"/><id>{url}</id>"
+                f"<updated>{published.isoformat()}</updated><summary type=\"html\">{description}</summary>"
+                f"<category term=\"{category}\"/><media:thumbnail url=\"{url}.jpg\"/></entry>"
+            )
+        else:
+            parts.append(
+                f"<item><title>{title}</title><link>{url}</link><guid>{url}</guid>"
+                f"<pubDate>{format_datetime(published)}</pubDate><description>{description}</description>"
+                f"<category>{category}</category><enclosure url=\"{url}.jpg\" type=\"image/jpeg\" length=\"0\"/></item>"
+            )
+
+    entries = "".join(parts)
+    if atom:
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:media="http://search.yahoo.com/mrss/">'
+            f"<title>{provider.title()} {category}</title>{entries}</feed>"
+        ).encode()
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        f"<title>{provider.title()} {category}</title><link>https://{provider}.example.com</link>{entries}</channel></rss>"
+    ).encode()
+
+class StubProviderHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests like the real providers
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+    failure_rate = 0.0
+    items_per_request = None
+
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        if self.latency:
+            time.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            return self._send(503, {"error": "stub failure"})
+
+        if parsed.path == "/v1/news":
+            category = params.get("categories", "general")
+            count = self.items_per_request or int(params.get("limit", 2))
+            return self._send(200, {"data": make_items(category, count, "mediastack")})
+
+        if parsed.path == "/v2/everything":
+            category = params.get("q", "general")
+            count = self.items_per_request or int(params.get("pageSize", 2))
+            articles = [{
+                "title": item["title"],
+                "description": item["description"],
+                "url": item["url"],
+                "urlToImage": item["image"],
+                "publishedAt": item["published_at"],
+                "source": {"name": item["source"]},
+            } for item in make_items(category, count, "newsapi")]
+            return self._send(200, {"articles": articles})
+
+        if parsed.path.startswith(("/rss/", "/atom/")):
+            return self._send_feed(parsed.path, params)
+
+        self._send(404, {"error": "not found"})
+
+    def _send_feed(self, path: str, params: Dict[str, str]) -> None:
+        kind, category = path.strip("/").split("/", 1)
+        count = self.items_per_request or int(params.get("count", 50))
+        # Feeds are static per URL, so their validators never change
+        etag = f'"{kind}-{category}-{count}"'
+        last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        if self.headers.get("If-None-Match") == etag or self.headers.get("If-Modified-Since") == last_modified:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = make_feed(category, count, kind, atom=kind == "atom")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/atom+xml" if kind == "atom" else "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+def start_stub_server(port: int = 0, latency: float = 0.0, failure_rate: float = 0.0, items_per_request: int = None) -> ThreadingHTTPServer:
+    """Serve the stub providers from a background thread; port 0 picks a free port"""
+    handler = type("ConfiguredStubHandler", (StubProviderHandler,), {
+        "latency": latency,
+        "failure_rate": failure_rate,
+        "items_per_request": items_per_request,
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=None)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.port, args.latency, args.failure_rate, args.items)
+    print(f"Stub providers listening on http://127.0.0.1:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -1,7 +1,11 @@
+import argparse
+import os
 import uvicorn
 import signal
 import sys
+from decouple import config
 from fastapi.middleware.cors import CORSMiddleware
+# Also imported by the process supervising the workers, so the schema exists before any of them starts
 from app.api import app
 
 app.add_middleware(
@@ -18,7 +22,26 @@ def handle_exit(signum, frame):
     sys.exit(0)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the API")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--workers", type=int, default=None, help="production mode: this many worker processes, no reload")
+    args = parser.parse_args()
+
     signal.signal(signal.SIGINT, handle_exit)
     signal.signal(signal.SIGTERM, handle_exit)
-    
-    uvicorn.run("app.api:app", host="0.0.0.0", port=8081, reload=True)
\ No newline at end of file
+
+    if args.workers is None:
+        uvicorn.run("app.api:app", host=args.host, port=args.port, reload=True)
+    else:
+        # Workers inherit the environment; a per-process cache would leave each worker cold
+        if args.workers > 1 and config("news_cache_backend", default=None) is None:
+            os.environ["news_cache_backend"] = "sqlite"
+        uvicorn.run(
+            "app.api:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            # Workers importing the app at the same time can take longer than uvicorn's 5s default to answer
+            timeout_worker_healthcheck=config("worker_healthcheck_timeout_seconds", default=30, cast=int)
+        )
@@ -3,12 +3,18 @@ from app.models.interest import Interest
 from app.models.news import News  # Add this import
 from app.models import user as models
 from app.models.user import Base  # Add this import
+from app.utils.search import ensure_search_index
+from sqlalchemy import text
 
 # Drop all existing tables
 Base.metadata.drop_all(bind=engine)
+# The search index is not part of the metadata and would point at dropped rows
+with engine.begin() as connection:
+    connection.execute(text("DROP TABLE IF EXISTS news_fts"))
 
 # Create all tables
 Base.metadata.create_all(bind=engine)
+ensure_search_index(engine)
 
 def seed_interests():
     db = SessionLocal()